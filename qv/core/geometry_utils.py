@@ -30,10 +30,7 @@ def calculate_distance(
     :param end_point: Ending point (x, y, z)
     :return: Distance between the two points
     """
-    dx = end_point[0] - start_point[0]
-    dy = end_point[1] - start_point[1]
-    dz = end_point[2] - start_point[2]
-    return math.sqrt(dx*dx + dy*dy + dz*dz)
+    return math.dist(start_point, end_point)
 
 
 def calculate_norm(vector: Tuple[float, float, float]) -> float:
@@ -43,7 +40,7 @@ def calculate_norm(vector: Tuple[float, float, float]) -> float:
     :param vector: Vector (x, y, z)
     :return: Magnitude of the vector
     """
-    return math.sqrt(vector[0] ** 2 + vector[1] ** 2 + vector[2] ** 2)
+    return math.hypot(vector[0], vector[1], vector[2])
 
 
 def transform_vector(
@@ -9,7 +9,7 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Command(Generic[T]):
     before: T
     after: T
@@ -60,21 +60,21 @@ class HistoryManager(Generic[T]):
         self._redo_stack.clear()
 
     def undo(self, apply_state: Callable[[T], None]) -> None:
-        logger.debug(f"undo stack size: {len(self._undo_stack)}")
+        logger.debug("undo stack size: %d", len(self._undo_stack))
         if not self._undo_stack:
             return
         cmd = self._undo_stack[-1]
         apply_state(cmd.before)
         self._undo_stack.pop()
         self._redo_stack.append(cmd)
-        logger.debug(f"undo: {cmd.before} -> {cmd.after}")
+        logger.debug("undo applied; undo=%d redo=%d", len(self._undo_stack), len(self._redo_stack))
 
     def redo(self, apply_state: Callable[[T], None]) -> None:
-        logger.debug(f"redo stack size: {len(self._redo_stack)}")
+        logger.debug("redo stack size: %d", len(self._redo_stack))
         if not self._redo_stack:
             return
         cmd = self._redo_stack[-1]
         apply_state(cmd.after)
         self._redo_stack.pop()
         self._undo_stack.append(cmd)
-        logger.debug(f"redo: {cmd.before} -> {cmd.after}")
\ No newline at end of file
+        logger.debug("redo applied; undo=%d redo=%d", len(self._undo_stack), len(self._redo_stack))
\ No newline at end of file
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Callable, Sequence
 
 import vtk
+from vtkmodules.util.numpy_support import vtk_to_numpy
 
 import logging
 import qv.utils.vtk_helpers as vtk_helpers
@@ -182,17 +183,17 @@ class RegionSelectionController:
     def _update_overlay(self) -> None:
         self._clear_overlay()
 
-        for x, y in self.display_points:
-            self._overlay_points.InsertNextPoint(x, y, 0.0)
-
         count = len(self.display_points)
+        self._overlay_points.SetNumberOfPoints(count)
+        if count:
+            xyz = vtk_to_numpy(self._overlay_points.GetData())
+            xyz[:, :2] = self.display_points
+            xyz[:, 2] = 0.0
+
         if count == 1:
-            self._overlay_verts.InsertNextCell(1)
-            self._overlay_verts.InsertCellPoint(0)
+            self._overlay_verts.InsertNextCell(1, [0])
         elif count >= 2:
-            self._overlay_lines.InsertNextCell(count)
-            for idx in range(count):
-                self._overlay_lines.InsertCellPoint(idx)
+            self._overlay_lines.InsertNextCell(count, range(count))
 
         self._overlay_actor.SetVisibility(1 if count else 0)
         self._overlay_points.Modified()
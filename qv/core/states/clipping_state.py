@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClippingState:
     """
     Immutable clipping state containing multiple clipping regions.
@@ -14,6 +14,7 @@ class ClippingState:
     - We do Not store VTK objects here (vtkImplicitSelectionLoop, filters, etc.).
     - Those are derived artifacts and belong to the viewer/pipeline layer.
     """
+    # zlib-compressed np.packbits of the keep mask (1 bit per voxel, 1=visible).
     mask_zlib: bytes | None
 
     @property
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 
-@dataclass
+@dataclass(frozen=True)
 class WindowSettings:
     """
     Immutable representation of window settings for medical image display.
@@ -43,6 +44,11 @@ class WindowSettings:
 
     def get_range(self) -> tuple[float, float]:
         """Get the minimum and maximum values of the window."""
+        return self._range
+
+    @cached_property
+    def _range(self) -> tuple[float, float]:
+        # Instances are frozen, so the range is computed at most once.
         return self.get_min(), self.get_max()
 
     def clamp(self, scalar_range: tuple[float, float]) -> WindowSettings:
@@ -50,15 +56,12 @@ class WindowSettings:
         Return a new WindowSettings clamped to the scalar range.
 
         :param scalar_range: (min, max) scalar range.
-        :return: New clamped WindowSettings instance
+        :return: New clamped WindowSettings instance, or self if already in range
         """
-        min_scalar, max_scalar = scalar_range
-        max_width = max_scalar - min_scalar
-
-        clamped_width = max(1.0, min(max_width, self.width))
-        clamped_level = max(min_scalar, min(max_scalar, self.level))
-
-        return WindowSettings(level=clamped_level, width=clamped_width)
+        level, width = _clamp_values(self.level, self.width, *scalar_range)
+        if level == self.level and width == self.width:
+            return self
+        return WindowSettings(level=level, width=width)
 
     def adjust(self,
                delta_level: float,
@@ -76,15 +79,13 @@ class WindowSettings:
         new_level = self.level + delta_level
         new_width = self.width + delta_width
 
-        try:
-            adjusted = WindowSettings(level=new_level, width=new_width)
-        except ValueError:
+        if new_width < self.MIN_WIDTH:
             return self
 
         if scalar_range is not None:
-            adjusted = adjusted.clamp(scalar_range)
+            new_level, new_width = _clamp_values(new_level, new_width, *scalar_range)
 
-        return adjusted
+        return WindowSettings(level=new_level, width=new_width)
 
     @classmethod
     def from_scalar_range(cls,
@@ -109,3 +110,12 @@ class WindowSettings:
         width = max(cls.MIN_WIDTH, width_fraction * full_range)
 
         return cls(level=level, width=width)
+
+
+def _clamp_values(level: float, width: float,
+                  min_scalar: float, max_scalar: float) -> tuple[float, float]:
+    """Clamp raw level/width values to a scalar range."""
+    max_width = max_scalar - min_scalar
+    width = max(1.0, min(max_width, width))
+    level = max(min_scalar, min(max_scalar, level))
+    return level, width
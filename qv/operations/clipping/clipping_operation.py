@@ -5,8 +5,9 @@ import logging
 from typing import TYPE_CHECKING, Sequence, Callable
 from enum import Enum, auto
 
+import numpy as np
 import vtk
-from matplotlib.backends import backend_registry
+from vtkmodules.util.numpy_support import vtk_to_numpy
 from vtkmodules.vtkCommonDataModel import vtkImplicitSelectionLoop
 from vtkmodules.vtkRenderingCore import vtkActor
 
@@ -306,8 +307,9 @@ class ClippingOperation(BaseOperation):
         front_depth = max(0.0, back_depth - 1e-6)
 
         vtk_points = vtk.vtkPoints()
-        for pt in self.clip_points_center:
-            vtk_points.InsertNextPoint(*pt)
+        vtk_points.SetDataTypeToDouble()
+        vtk_points.SetNumberOfPoints(len(self.clip_points_center))
+        vtk_to_numpy(vtk_points.GetData())[:] = np.asarray(self.clip_points_center, dtype=np.float64)
 
         self.clip_loop = vtkImplicitSelectionLoop()
         self.clip_loop.SetLoop(vtk_points)
@@ -589,10 +591,7 @@ class ClippingOperation(BaseOperation):
 
         lines = vtk.vtkCellArray()
         num_pts = vtk_points.GetNumberOfPoints()
-        lines.InsertNextCell(num_pts + 1)
-        for i in range(num_pts):
-            lines.InsertCellPoint(i)
-        lines.InsertCellPoint(0)
+        lines.InsertNextCell(num_pts + 1, [*range(num_pts), 0])
         poly.SetLines(lines)
 
         extrude_back = vtk.vtkLinearExtrusionFilter()
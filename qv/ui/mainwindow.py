@@ -3,12 +3,11 @@ from pathlib import Path
 
 from PySide6 import QtCore
 from PySide6.QtGui import QAction, QActionGroup
-from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QSplitter,
+from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QSplitter,
                                QHBoxLayout, QLabel, QPushButton)
 
 from qv.app.app_settings_manager import AppSettingsManager
 from qv.utils.resource_paths import settings_dir
-from qv.viewers.camera.camera_state import CameraAngle
 from qv.utils.log_util import log_io
 from qv.app.status import STATUS_FIELDS, StatusField
 from qv.app.shortcut_manager import ShortcutManager
@@ -16,6 +15,7 @@ from qv.viewers.mpr_viewer import MprViewer, MprPlane
 from qv.ui.widgets.histgram_widget import HistogramWidget
 from qv.ui.widgets.multi_viewer_panel import MultiViewerPanel, ViewerLayoutMode
 from qv.ui.dialogs.settings_dialog import SettingsDialog
+from qv.ui.dialogs.error_notifier import ErrorNotifier
 import qv.utils.vtk_helpers as vtk_helpers
 import copy
 
@@ -48,6 +48,8 @@ class MainWindow(QMainWindow):
             k: copy.deepcopy(v) for k, v in STATUS_FIELDS.items()
         }
         self._status_label: dict[str, QLabel] = {}
+        # True while a background volume load holds the busy cursor.
+        self._loading = False
 
         # Setup UI
         self.setWindowTitle("QV - DICOM Viewer")
@@ -94,6 +96,8 @@ class MainWindow(QMainWindow):
         self.volume_viewer.cameraAngleChanged.connect(self._on_camera_angle_changed)
         self.volume_viewer.windowSettingsChanged.connect(self._on_window_settings_changed)
         self.volume_viewer.dataLoaded.connect(self._on_data_loaded)
+        self.volume_viewer.loadStarted.connect(self._on_load_started)
+        self.volume_viewer.loadFailed.connect(self._on_load_failed)
 
     def _setup_menus(self) -> None:
         """Create the menus for the main window."""
@@ -354,14 +358,16 @@ class MainWindow(QMainWindow):
     # Signal Handlers
     # =====================================================
 
-    def _on_camera_angle_changed(self, angle: CameraAngle) -> None:
+    @QtCore.Slot(float, float)
+    def _on_camera_angle_changed(self, azimuth: float, elevation: float) -> None:
         """
         Handle camera angle change.
 
-        :param angle: New camera angle
+        :param azimuth: New camera azimuth
+        :param elevation: New camera elevation
         """
-        self._update_status("azimuth", angle.azimuth)
-        self._update_status("elevation", angle.elevation)
+        self._update_status("azimuth", azimuth)
+        self._update_status("elevation", elevation)
 
     def _on_window_settings_changed(self, _window_settings: object) -> None:
         """Handle window level/width change."""
@@ -386,8 +392,29 @@ class MainWindow(QMainWindow):
             logger.warning(f"Error formatting status field {key}: {e}")
             label.setText(str(value))
 
+    def _on_load_started(self, dicom_dir: str) -> None:
+        """Show that a background volume load is in progress."""
+        self.statusBar().showMessage(f"Loading {dicom_dir} ...")
+        if not self._loading:
+            self._loading = True
+            QApplication.setOverrideCursor(QtCore.Qt.CursorShape.BusyCursor)
+
+    def _on_load_failed(self, message: str) -> None:
+        """Report a failed background volume load to the user."""
+        self._end_loading()
+        self.statusBar().showMessage("Failed to load volume", 5000)
+        ErrorNotifier.instance().notify("Failed to load volume", message)
+
+    def _end_loading(self) -> None:
+        """Drop the busy indicator set by _on_load_started."""
+        if self._loading:
+            self._loading = False
+            QApplication.restoreOverrideCursor()
+            self.statusBar().clearMessage()
+
     def _on_data_loaded(self) -> None:
         """Handle data loaded event."""
+        self._end_loading()
         logger.debug("Data loaded, updating histogram")
 
         if self.volume_viewer._source_image is None:
@@ -1,15 +1,17 @@
+import logging
 import math
 from pathlib import Path
 
 import vtk
 import numpy as np
 from PySide6 import QtWidgets
-from matplotlib import pyplot as plt
 from vtkmodules.util.numpy_support import vtk_to_numpy
 
 from qv.core import geometry_utils
 from qv.core.patient_geometry import PatientFrame, build_patient_frame
 
+logger = logging.getLogger(__name__)
+
 
 def load_dicom_series(directory: str) -> vtk.vtkImageData:
     """Load a DICOM series from a directory."""
@@ -19,6 +21,43 @@ def load_dicom_series(directory: str) -> vtk.vtkImageData:
     return reader.GetOutput()
 
 
+# Integer scalar types wider than 16 bits, narrowed when their range allows.
+_WIDE_INTEGER_TYPES = (
+    vtk.VTK_INT, vtk.VTK_UNSIGNED_INT,
+    vtk.VTK_LONG, vtk.VTK_UNSIGNED_LONG,
+    vtk.VTK_LONG_LONG, vtk.VTK_UNSIGNED_LONG_LONG,
+    vtk.VTK_ID_TYPE,
+)
+
+
+def narrow_to_16bit_scalars(image: vtk.vtkImageData) -> vtk.vtkImageData:
+    """
+    Return the image with integer scalars wider than 16 bits narrowed to short/ushort.
+
+    The cast only happens when the scalar range fits the 16-bit type, so it is
+    lossless. 8-bit, 16-bit and floating-point images are returned unchanged.
+    """
+    scalar_type = image.GetScalarType()
+    if scalar_type not in _WIDE_INTEGER_TYPES:
+        return image
+
+    lo, hi = image.GetScalarRange()
+    cast = vtk.vtkImageCast()
+    if lo >= -32768 and hi <= 32767:
+        cast.SetOutputScalarTypeToShort()
+    elif lo >= 0 and hi <= 65535:
+        cast.SetOutputScalarTypeToUnsignedShort()
+    else:
+        logger.warning(
+            "Scalar range %s..%s does not fit 16 bits; keeping %s scalars.",
+            lo, hi, image.GetScalarTypeAsString(),
+        )
+        return image
+    cast.SetInputData(image)
+    cast.Update()
+    return cast.GetOutput()
+
+
 def load_dicom_series_with_patient_frame(directory: str) -> tuple[vtk.vtkImageData, PatientFrame]:
     """Load a DICOM series from a directory and return the patient frame."""
     image = load_dicom_series(directory)
@@ -50,6 +89,9 @@ def vtk_image_to_numpy(image: vtk.vtkImageData, sampling: int = 1) -> np.ndarray
 
 
 def plot_hist_clip(volume, bins=100, lower_pct=25, upper_pct=99):
+    # Debug-only plotting; keep matplotlib out of the application's import path.
+    from matplotlib import pyplot as plt
+
     data = volume.flatten()
     vmin, vmax = np.percentile(data, [lower_pct, upper_pct])
     vmin = -1024
@@ -3,10 +3,12 @@ from __future__ import annotations
 
 import logging
 from abc import ABCMeta, abstractmethod
-from typing import TYPE_CHECKING
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
 
 import vtk
 from PySide6 import QtWidgets, QtCore
+from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 
 from qv.app.app_settings_manager import AppSettingsManager
 from qv.core.window_settings import WindowSettings
@@ -18,6 +20,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Optional vtkRenderer features, probed once instead of per viewer.
+_HAS_BG_ALPHA = hasattr(vtk.vtkRenderer, "SetBackgroundAlpha")
+_HAS_USE_DEPTH = hasattr(vtk.vtkRenderer, "SetUseDepth")
+
 
 class ABCQtMeta(ABCMeta, type(QtWidgets.QWidget)):
     """
@@ -44,27 +50,54 @@ class BaseViewer(QtWidgets.QWidget, metaclass=ABCQtMeta):
     """
 
     # Signals
-    cameraAngleChanged = QtCore.Signal(object)
+    cameraAngleChanged = QtCore.Signal(float, float)  # azimuth, elevation
     dataLoaded = QtCore.Signal()
     windowSettingsChanged = QtCore.Signal(object)
 
+    # Legacy init order: set the interactor style before Initialize().
+    STYLE_BEFORE_INITIALIZE: bool = False
+
+    # Follow every camera change into cameraAngleChanged. Only viewers whose
+    # angle is shown need it; it costs a little work on each pan/zoom.
+    TRACK_CAMERA_ANGLE: bool = False
+
+    # Minimum delay between coalesced renders (~60 Hz).
+    RENDER_INTERVAL_MS: int = 16
+
     def __init__(
             self,
             settings_manager: AppSettingsManager | None = None,
             parent: QtWidgets.QWidget | None = None,
+            enable_overlay: bool = False,
     ) -> None:
         """
         Initialize the base viewer.
         :param settings_manager: Application settings manager
         :param parent: Parent widget
+        :param enable_overlay: Attach the overlay renderer on render layer 1 from
+                               the start. Otherwise it stays detached until
+                               set_overlay_enabled(True).
         """
         super().__init__(parent)
         self.setting = settings_manager or AppSettingsManager()
+        self._enable_overlay = enable_overlay
 
         # Shared WW/WL state and HUD actor.
         self._window_settings: WindowSettings | None = None
         self._window_overlay_actor: vtk.vtkTextActor | None = None
 
+        # Coalesces interaction-driven renders, capped at one per interval.
+        self._render_timer = QtCore.QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(self.RENDER_INTERVAL_MS)
+        self._render_timer.timeout.connect(self.update_view)
+
+        # While _batched() is active, WW/WL signals and renders are deferred
+        # and delivered once on exit.
+        self._batch_depth = 0
+        self._pending_window_signal: WindowSettings | None = None
+        self._pending_render = False
+
         self._setup_ui()
         self._setup_vtk_rendering()
         self._init_window_overlay()
@@ -73,11 +106,22 @@ class BaseViewer(QtWidgets.QWidget, metaclass=ABCQtMeta):
         self.camera_controller = CameraController(
             self.renderer.GetActiveCamera(),
             self.renderer,
+            track_angle=self.TRACK_CAMERA_ANGLE,
         )
         self.camera_controller.add_angle_changed_callback(self._on_camera_angle_changed)
-
-        self.setup_interactor_style()
-        self._initialize_interactor()
+        # closeEvent never reaches viewers embedded as child widgets, so the
+        # camera observer is also detached when the widget itself goes away.
+        self.destroyed.connect(self.camera_controller.dispose)
+
+        # Styles are bound to an already initialized interactor so they don't
+        # get rebound on the first render. Subclasses that depend on the old
+        # order can set STYLE_BEFORE_INITIALIZE = True.
+        if self.STYLE_BEFORE_INITIALIZE:
+            self.setup_interactor_style()
+            self._initialize_interactor()
+        else:
+            self._initialize_interactor()
+            self.setup_interactor_style()
 
     def _initialize_interactor(self) -> None:
         """
@@ -94,8 +138,6 @@ class BaseViewer(QtWidgets.QWidget, metaclass=ABCQtMeta):
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
-
         self.vtk_widget = QVTKRenderWindowInteractor(self)
         layout.addWidget(self.vtk_widget)
         self.setLayout(layout)
@@ -110,21 +152,34 @@ class BaseViewer(QtWidgets.QWidget, metaclass=ABCQtMeta):
         self.renderer = vtk.vtkRenderer()
         self.renderer.SetLayer(0)
         render_window.AddRenderer(self.renderer)
-        render_window.SetNumberOfLayers(2)
 
         # Overlay renderer (layer 1) - for annotations, overlays, etc.
+        # Only attached while needed so the window skips the extra layer pass.
         self.overlay_renderer = vtk.vtkRenderer()
         self.overlay_renderer.SetLayer(1)
         self.overlay_renderer.SetInteractive(False)
-        if hasattr(self.overlay_renderer, "SetBackgroundAlpha"):
+        if _HAS_BG_ALPHA:
             self.overlay_renderer.SetBackgroundAlpha(0.0)
-        if hasattr(self.overlay_renderer, "SetUseDepth"):
+        if _HAS_USE_DEPTH:
             self.overlay_renderer.SetUseDepth(0)
-        render_window.AddRenderer(self.overlay_renderer)
+        render_window.SetNumberOfLayers(1)
+        self.set_overlay_enabled(self._enable_overlay)
 
         self.interactor = render_window.GetInteractor()
         logger.debug("VTK rendering components initialized.")
 
+    def set_overlay_enabled(self, enabled: bool) -> None:
+        """Attach or detach the overlay renderer (render layer 1)."""
+        render_window = self.vtk_widget.GetRenderWindow()
+        if enabled == bool(render_window.HasRenderer(self.overlay_renderer)):
+            return
+        if enabled:
+            render_window.SetNumberOfLayers(2)
+            render_window.AddRenderer(self.overlay_renderer)
+        else:
+            render_window.RemoveRenderer(self.overlay_renderer)
+            render_window.SetNumberOfLayers(1)
+
     # =====================================================
     # Shared WW/WL Overlay (task 1)
     # =====================================================
@@ -149,7 +204,8 @@ class BaseViewer(QtWidgets.QWidget, metaclass=ABCQtMeta):
         actor.SetPosition(0.98, 0.01)
         actor.VisibilityOff()
 
-        self.overlay_renderer.AddActor(actor)
+        # Viewers that detach the overlay keep the HUD on the main renderer.
+        (self.overlay_renderer if self._enable_overlay else self.renderer).AddActor(actor)
         self._window_overlay_actor = actor
 
     def _set_window_overlay_text(self, text: str) -> None:
@@ -221,11 +277,36 @@ class BaseViewer(QtWidgets.QWidget, metaclass=ABCQtMeta):
         changed = self._apply_window_settings(settings)
 
         if emit_signal:
-            self.windowSettingsChanged.emit(settings)
+            if self._batch_depth:
+                self._pending_window_signal = settings
+            else:
+                self.windowSettingsChanged.emit(settings)
 
         if render and changed:
             self.update_view()
 
+    @contextmanager
+    def _batched(self) -> Iterator[None]:
+        """
+        Defer windowSettingsChanged and update_view until the outermost block exits.
+
+        Only the last settings are emitted, and at most one render is issued.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                settings = self._pending_window_signal
+                render = self._pending_render
+                self._pending_window_signal = None
+                self._pending_render = False
+                if settings is not None:
+                    self.windowSettingsChanged.emit(settings)
+                if render:
+                    self.update_view()
+
     @property
     def window_settings(self) -> WindowSettings | None:
         """Return the current window settings."""
@@ -270,7 +351,7 @@ class BaseViewer(QtWidgets.QWidget, metaclass=ABCQtMeta):
         :param angle: New camera angle
         :return:
         """
-        self.cameraAngleChanged.emit(angle)
+        self.cameraAngleChanged.emit(angle.azimuth, angle.elevation)
 
     # =====================================================
     # Rendering
@@ -278,8 +359,23 @@ class BaseViewer(QtWidgets.QWidget, metaclass=ABCQtMeta):
 
     def update_view(self) -> None:
         """Trigger a render."""
+        if self._batch_depth:
+            self._pending_render = True
+            return
+        # A direct render satisfies any render that is still queued.
+        self._render_timer.stop()
         self.vtk_widget.Render()
 
+    def request_render(self) -> None:
+        """
+        Queue a render after RENDER_INTERVAL_MS.
+
+        Repeated requests before the queued render runs collapse into one, so
+        fast drags render at most once per interval.
+        """
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+
     def reset_camera(self) -> None:
         """Reset the camera to the default position."""
         self.renderer.ResetCamera()
@@ -291,6 +387,8 @@ class BaseViewer(QtWidgets.QWidget, metaclass=ABCQtMeta):
 
     def closeEvent(self, event) -> None:
         """Handle close event."""
+        if hasattr(self, "camera_controller"):
+            self.camera_controller.dispose()
         if hasattr(self, "interactor") and self.interactor:
             self.interactor.TerminateApp()
         super().closeEvent(event)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import math
 from typing import Literal
 
+import numpy as np
 import vtk
 import logging
 
@@ -14,8 +16,6 @@ CAMERA_VIEWUPS_PATIENT,
 PatientFrame,
 )
 
-from qv.utils import vtk_helpers
-
 logger = logging.getLogger(__name__)
 
 ViewDirection = Literal['front', 'back', 'left', 'right', 'top', 'bottom']
@@ -37,12 +37,32 @@ class CameraPreset:
 class CameraController:
     """Handles camera operations."""
 
-    def __init__(self, camera: vtk.vtkCamera, renderer: vtk.vtkRenderer) -> None:
+    def __init__(self, camera: vtk.vtkCamera, renderer: vtk.vtkRenderer,
+                 track_angle: bool = True) -> None:
+        """
+        :param camera: Camera to control
+        :param renderer: Renderer owning the camera
+        :param track_angle: Follow camera motion from any source (e.g. the
+            interactor) into the angle state. Without it only preset views
+            set the angle.
+        """
         self.camera = camera
         self.renderer = renderer
         self.state = CameraStateManager()
         self._patient_frame: PatientFrame | None = None
 
+        # (camera mtime, focal point, unit view direction, distance) after set_zoom().
+        self._zoom_cache: tuple | None = None
+
+        # Keep the angle state in sync with VTK's own camera, whatever mutated it.
+        self._last_camera_pose: tuple | None = None
+        self._last_direction: np.ndarray | None = self._unit_direction()
+        self._camera_observer: int | None = None
+        if track_angle:
+            self._camera_observer = camera.AddObserver(
+                vtk.vtkCommand.ModifiedEvent, self._on_camera_modified
+            )
+
     @property
     def azimuth(self) -> float:
         """Current azimuth angle in degrees."""
@@ -61,6 +81,35 @@ class CameraController:
         """Set the shared patient frame used by the loaded volume."""
         self._patient_frame = frame
 
+    def dispose(self) -> None:
+        """Detach the camera observer. Call when the owning viewer closes."""
+        if self._camera_observer is not None:
+            self.camera.RemoveObserver(self._camera_observer)
+            self._camera_observer = None
+
+    def _on_camera_modified(self, caller: vtk.vtkCamera, event: str) -> None:
+        """
+        Push the camera's angles into the state after a VTK-side change.
+
+        Only position/focal point changes affect the angles, so view-up or
+        parallel-scale updates are ignored. Explicit preset angles set later
+        in the same batch take precedence.
+        """
+        pose = (caller.GetPosition(), caller.GetFocalPoint())
+        if pose == self._last_camera_pose:
+            return
+        self._last_camera_pose = pose
+
+        previous = self._last_direction
+        self._last_direction = self._unit_direction()
+        if previous is None or self._last_direction is None:
+            return
+        delta_azimuth, delta_elevation = self._angle_delta(previous, self._last_direction)
+        self.state.set_angle(CameraAngle(
+            self.state.azimuth + delta_azimuth,
+            self.state.elevation + delta_elevation,
+        ))
+
     def rotate(self, delta_azimuth: float, delta_elevation: float):
         """
         Rotate the camera by delta angles
@@ -69,19 +118,20 @@ class CameraController:
         :param delta_elevation: Elevation change in degrees
         return: New camera angles
         """
-        self.camera.Azimuth(delta_azimuth)
-        self.camera.Elevation(delta_elevation)
-        self.camera.OrthogonalizeViewUp()
-
-        new_angle = CameraAngle(
-            self.state.azimuth + delta_azimuth,
-            self.state.elevation + delta_elevation)
-
-        self.state.set_angle(new_angle)
-        self.renderer.ResetCameraClippingRange()
-
-        logger.debug(f"Camera rotation: {delta_azimuth}, {delta_elevation}")
-        self.renderer.ResetCameraClippingRange()
+        # The ModifiedEvent observer, when attached, updates the angle state
+        # from the camera.
+        with self.state.batch():
+            self.camera.Azimuth(delta_azimuth)
+            self.camera.Elevation(delta_elevation)
+            self.camera.OrthogonalizeViewUp()
+            if self._camera_observer is None:
+                self.state.set_angle(CameraAngle(
+                    self.state.azimuth + delta_azimuth,
+                    self.state.elevation + delta_elevation,
+                ))
+            self.renderer.ResetCameraClippingRange()
+
+        logger.debug("Camera rotation: %s, %s", delta_azimuth, delta_elevation)
 
         return self.state.angle
 
@@ -111,12 +161,14 @@ class CameraController:
 
         new_pos = tuple(fp[i] + direction[i] * distance for i in range(3))
 
-        self.camera.SetPosition(*new_pos)
-        self.camera.SetFocalPoint(*fp)
-        self.camera.SetViewUp(*view_up)
+        # Notify subscribers only once the camera has fully settled.
+        with self.state.batch():
+            self.camera.SetPosition(*new_pos)
+            self.camera.SetFocalPoint(*fp)
+            self.camera.SetViewUp(*view_up)
 
-        self.state.set_angle(CameraAngle(target_angles[0], target_angles[1]))
-        self.renderer.ResetCameraClippingRange()
+            self.state.set_angle(CameraAngle(target_angles[0], target_angles[1]))
+            self.renderer.ResetCameraClippingRange()
 
         logger.info(f"Camera preset view: {view}, angles: {target_angles}")
 
@@ -129,16 +181,20 @@ class CameraController:
         :param factor: zoom factor  (1.0 = default, 2.0 = 2x zoom)
         :param default_distance: Default distance for factor = 1.0
         """
-        fp = self.camera.GetFocalPoint()
-        pos = self.camera.GetPosition()
-        direction = geometry_utils.direction_vector(fp, pos)
-        norm = geometry_utils.calculate_norm(direction)
+        cache = self._zoom_cache
+        if cache is not None and cache[0] == self.camera.GetMTime():
+            _, fp, unit_direction, norm = cache
+        else:
+            fp = self.camera.GetFocalPoint()
+            pos = self.camera.GetPosition()
+            direction = geometry_utils.direction_vector(fp, pos)
+            norm = geometry_utils.calculate_norm(direction)
 
-        if norm == 0:
-            logger.warning("Camera direction vector has zero length. Aborting set_zoom().")
-            return
+            if norm == 0:
+                logger.warning("Camera direction vector has zero length. Aborting set_zoom().")
+                return
 
-        unit_direction = tuple(d / norm for d in direction)
+            unit_direction = tuple(d / norm for d in direction)
 
         if default_distance is None:
             default_distance = norm
@@ -146,43 +202,60 @@ class CameraController:
         new_distance = default_distance / factor
         new_position = tuple(fp[i] + unit_direction[i] * new_distance for i in range(3))
 
-        self.camera.SetPosition(*new_position)
-
-        new_angle = self._calculate_angles_from_camera()
-        self.state.set_angle(new_angle)
+        with self.state.batch():
+            self.camera.SetPosition(*new_position)
+            self.renderer.ResetCameraClippingRange()
 
-        self.renderer.ResetCameraClippingRange()
+        # Zooming keeps the view direction, so the next call can reuse it
+        # as long as nothing else touched the camera in between.
+        self._zoom_cache = (self.camera.GetMTime(), fp, unit_direction, new_distance)
 
-        logger.debug(f"Camera zoom factor: {factor}, new distance: {new_distance}")
+        logger.debug("Camera zoom factor: %s, new distance: %s", factor, new_distance)
 
     def reset_to_bounds(self, bounds: tuple[float, float, float, float, float, float],
                         view: ViewDirection = 'front') -> None:
         """Reset the camera to the bounds of the volume."""
-        center = (
-            0.5 * (bounds[0] + bounds[1]),
-            0.5 * (bounds[2] + bounds[3]),
-            0.5 * (bounds[4] + bounds[5]),
-        )
+        b = np.asarray(bounds, dtype=float).reshape(3, 2)
+        center = b.mean(axis=1)
 
         # Calculate appropriate distance
-        max_dim = max(
-            bounds[1] - bounds[0],
-            bounds[3] - bounds[2],
-            bounds[5] - bounds[4],
-        )
+        max_dim = float((b[:, 1] - b[:, 0]).max())
         distance = 2.0 * max_dim
 
-        self.camera.SetFocalPoint(*center)
-        self._set_preset_view_with_distance(view, center, distance)
+        # One notification at most, and none if the preset angle is unchanged.
+        with self.state.batch():
+            self.camera.SetFocalPoint(*center)
+            self._set_preset_view_with_distance(view, center, distance)
 
-    def _calculate_angles_from_camera(self) -> CameraAngle:
-        """
-        Calculate azimuth and elevation from current camera position.
+    def _unit_direction(self) -> np.ndarray | None:
+        """Return the unit vector from the focal point to the camera, or None."""
+        direction = np.subtract(self.camera.GetPosition(), self.camera.GetFocalPoint())
+        norm = np.linalg.norm(direction)
+        if norm == 0:
+            return None
+        return direction / norm
 
-        :return: camera angles
+    def _angle_delta(self, previous: np.ndarray, current: np.ndarray) -> tuple[float, float]:
+        """
+        Azimuth/elevation step, in degrees, from ``previous`` to ``current`` direction.
+
+        Measured about the current view-up, in the same sense as
+        vtkCamera.Azimuth/Elevation. VTK fires ModifiedEvent for each of
+        those calls, so steps are small and summing them keeps the angles
+        unbounded like rotate() deltas. A single elevation step of 90 degrees
+        or more is measured against the already-rotated view-up, so it folds
+        into azimuth + 180: Elevation(120) reads as (180, -60).
         """
-        azimuth, elevation = vtk_helpers.get_camera_angles(self.camera)
-        return CameraAngle(azimuth, elevation)
+        up = np.asarray(self.camera.GetViewUp(), dtype=float)
+        up -= np.dot(up, previous) * previous
+        up_norm = np.linalg.norm(up)
+        if up_norm == 0:
+            return 0.0, 0.0
+        up /= up_norm
+        right = np.cross(up, previous)
+        azimuth = math.degrees(math.atan2(np.dot(current, right), np.dot(current, previous)))
+        elevation = math.degrees(math.asin(float(np.clip(np.dot(current, up), -1.0, 1.0))))
+        return azimuth, elevation
 
     def _set_preset_view_with_distance(self, view: ViewDirection,
                                        focal_point: tuple[float, float, float],
@@ -208,26 +281,27 @@ class CameraController:
             focal_point[i] + direction[i] * distance for i in range(3)
         )
 
-        self.camera.SetPosition(*new_position)
-        self.camera.SetFocalPoint(*focal_point)
-        self.camera.SetViewUp(*view_up)
+        with self.state.batch():
+            self.camera.SetPosition(*new_position)
+            self.camera.SetFocalPoint(*focal_point)
+            self.camera.SetViewUp(*view_up)
 
-        self.state.set_angle(CameraAngle(target_angles[0], target_angles[1]))
-        self.renderer.ResetCameraClippingRange()
+            self.state.set_angle(CameraAngle(target_angles[0], target_angles[1]))
+            self.renderer.ResetCameraClippingRange()
 
         return self.state.angle
 
     def get_position(self) -> tuple[float, float, float]:
         """Get the current camera position."""
-        return tuple(self.camera.GetPosition())
+        return self.camera.GetPosition()
 
     def get_focal_point(self) -> tuple[float, float, float]:
         """Get the current camera focal point."""
-        return tuple(self.camera.GetFocalPoint())
+        return self.camera.GetFocalPoint()
 
     def get_view_up(self) -> tuple[float, float, float]:
         """Get the current camera view up vector."""
-        return tuple(self.camera.GetViewUp())
+        return self.camera.GetViewUp()
 
     def get_distance(self) -> float:
         """Get the distance between the camera position and focal point."""
@@ -1,6 +1,8 @@
 """Camera state management separated from UI concerns."""
 from __future__ import annotations
+from contextlib import contextmanager
 from dataclasses import dataclass
+from typing import Iterator
 import logging
 
 
@@ -26,11 +28,22 @@ class CameraStateManager:
     - Tracking camera angles and position.
     - Callbacks for camera state changes.
     - Don't have concerns about UI.
+
+    Several updates can be grouped with ``batch()`` so that subscribers are
+    notified once, after the camera has fully settled.
     """
 
     def __init__(self):
         self._angle: CameraAngle = CameraAngle(0.0, 0.0)
         self._on_angle_changed_callbacks: list[callable] = []
+        # Direct reference when exactly one callback is registered (the
+        # common BaseViewer case), so dispatch skips the iteration machinery.
+        self._single_callback: callable | None = None
+
+        # Nesting depth of batch() and whether a notification was deferred.
+        self._suspend_notifications: int = 0
+        self._notification_pending: bool = False
+        self._batch_start_angle: CameraAngle | None = None
 
     @property
     def angle(self) -> CameraAngle:
@@ -64,24 +77,79 @@ class CameraStateManager:
         if new_angle.azimuth != self._angle.azimuth or \
             new_angle.elevation != self._angle.elevation:
             self._angle = new_angle
-            self._notify_angle_changed()
+            if self._suspend_notifications:
+                self._notification_pending = True
+            else:
+                self._notify_angle_changed()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer angle-changed notifications until the outermost batch exits.
+
+        Callbacks fire at most once per batch, with the final angle, and not
+        at all if the batch ends on the angle it started from.
+        """
+        if self._suspend_notifications == 0:
+            self._batch_start_angle = self._angle
+        self._suspend_notifications += 1
+        try:
+            yield
+        finally:
+            self._suspend_notifications -= 1
+            if self._suspend_notifications == 0 and self._notification_pending:
+                self._notification_pending = False
+                if self._angle != self._batch_start_angle:
+                    self._notify_angle_changed()
 
     def add_angle_changed_callback(self, callback: callable) -> None:
         """
         Add a callback for camera angle changes.
 
         Callback signature: callback(angle: CameraAngle)-> None
+        Registering the same callback twice is a no-op.
         """
+        if callback in self._on_angle_changed_callbacks:
+            return
         self._on_angle_changed_callbacks.append(callback)
+        self._refresh_single_callback()
 
     def remove_angle_changed_callback(self, callback: callable) -> None:
         """Remove a callback for camera angle changes."""
         self._on_angle_changed_callbacks.remove(callback)
+        self._refresh_single_callback()
+
+    def _refresh_single_callback(self) -> None:
+        """Update the single-subscriber fast path after registration changes."""
+        callbacks = self._on_angle_changed_callbacks
+        self._single_callback = callbacks[0] if len(callbacks) == 1 else None
 
     def _notify_angle_changed(self) -> None:
-        """Notify callbacks of camera angle changes."""
-        for callback in self._on_angle_changed_callbacks:
+        """
+        Notify callbacks of camera angle changes.
+
+        Iterates a snapshot so callbacks may add/remove subscribers. The
+        try block wraps the whole loop and resumes the same iterator after a
+        failure, so one broken callback does not starve the rest.
+        """
+        single = self._single_callback
+        if single is not None:
+            try:
+                single(self._angle)
+            except Exception:
+                logging.exception("Error in camera angle callback %r", single)
+            return
+
+        if not self._on_angle_changed_callbacks:
+            return
+
+        angle = self._angle
+        callbacks = iter(tuple(self._on_angle_changed_callbacks))
+        callback = None
+        while True:
             try:
-                callback(self._angle)
-            except Exception as e:
-                logging.exception(f"Error in callback: {e}")
+                for callback in callbacks:
+                    callback(angle)
+                return
+            except Exception:
+                logging.exception("Error in camera angle callback %r", callback)
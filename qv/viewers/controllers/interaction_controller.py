@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import logging
-from enum import Enum, auto
+from array import array
+from collections import defaultdict
+from enum import Enum, IntEnum, auto
 from typing import Callable, Optional, TYPE_CHECKING
 
 from PySide6.QtCore import QPoint
@@ -13,8 +15,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Nested modes rarely go deeper than a few levels.
+MODE_STACK_CAPACITY = 16
 
-class InteractionMode(Enum):
+
+class InteractionMode(IntEnum):
     """Enum for different interaction modes."""
     DEFAULT = auto()
     CAMERA_ROTATION = auto()
@@ -25,6 +30,14 @@ class InteractionMode(Enum):
     ZOOM = auto()
 
 
+# Log lines for every mode pair, built once instead of per transition.
+_TRANSITION_MESSAGES: dict[tuple[InteractionMode, InteractionMode], str] = {
+    (a, b): f"Interaction mode changed from {a.name} -> {b.name}"
+    for a in InteractionMode
+    for b in InteractionMode
+}
+
+
 class MouseButton(Enum):
     """Enum for different mouse buttons."""
     LEFT = auto()
@@ -52,12 +65,16 @@ class InteractionController:
     def __init__(self):
         """Initialize the interaction controller."""
         self._current_mode: InteractionMode = InteractionMode.DEFAULT
-        self._mode_stack: list[InteractionMode] = []
+        # Fixed-capacity stack of InteractionMode values; push/pop allocate nothing.
+        self._mode_stack = array('B', bytes(MODE_STACK_CAPACITY))
+        self._mode_stack_top: int = 0
 
-        # Callbacks for interaction events
-        self._on_mode_changed_callbacks: list[Callable[[InteractionMode, InteractionMode], None]] = []
-        self._on_mode_enter_callbacks: dict[InteractionMode, list[Callable[[], None]]] = {}
-        self._on_mode_exit_callbacks: dict[InteractionMode, list[Callable[[], None]]] = {}
+        # Callbacks for interaction events.
+        # Stored as tuples and replaced on registration, so dispatch can iterate
+        # them directly while callbacks register further callbacks.
+        self._on_mode_changed_callbacks: tuple[Callable[[InteractionMode, InteractionMode], None], ...] = ()
+        self._on_mode_enter_callbacks: defaultdict[InteractionMode, tuple[Callable[[], None], ...]] = defaultdict(tuple)
+        self._on_mode_exit_callbacks: defaultdict[InteractionMode, tuple[Callable[[], None], ...]] = defaultdict(tuple)
 
         # Optional reference to VTK interactor for coodination
         self._vtk_interactor: vtk.vtkRenderWindowInteractor | None = None
@@ -70,7 +87,9 @@ class InteractionController:
     @property
     def previous_mode(self) -> InteractionMode | None:
         """Get previous interaction mode."""
-        return self._mode_stack[-1] if self._mode_stack else None
+        if not self._mode_stack_top:
+            return None
+        return InteractionMode(self._mode_stack[self._mode_stack_top - 1])
 
     def get_previous_mode_or_default(self) -> InteractionMode:
         """Get previous interaction mode, or default mode if stack is empty."""
@@ -79,12 +98,12 @@ class InteractionController:
     @property
     def has_history(self) -> bool:
         """Check if there is mode history."""
-        return bool(self._mode_stack)
+        return self._mode_stack_top > 0
 
     @property
     def mode_stack_depth(self) -> int:
         """Get depth of the mode stack."""
-        return len(self._mode_stack)
+        return self._mode_stack_top
 
     def set_vtk_interactor(self, interactor: vtk.vtkRenderWindowInteractor) -> None:
         """
@@ -110,16 +129,17 @@ class InteractionController:
 
         old_mode = self._current_mode
 
-        self._triggered_mode_exit(old_mode)
+        self._trigger_mode_exit(old_mode)
 
         if record_history:
-            self._mode_stack.append(old_mode)
+            self._push_history(old_mode)
 
         self._current_mode = mode
 
-        logger.info(f"Interaction mode changed from {old_mode} -> {mode}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_TRANSITION_MESSAGES[old_mode, mode])
 
-        self._triggered_mode_enter(mode)
+        self._trigger_mode_enter(mode)
         self._notify_mode_changed(old_mode, mode)
 
     def push_mode(self, mode: InteractionMode) -> None:
@@ -128,7 +148,7 @@ class InteractionController:
         :param mode: New interaction mode
         """
         self.set_mode(mode, record_history=True)
-        logger.debug(f"Mode pushed: {mode.name} (stack depth: {self.mode_stack_depth})")
+        logger.debug("Mode pushed: %s (stack depth: %d)", mode.name, self.mode_stack_depth)
 
     def pop_mode(self) -> bool:
         """
@@ -136,13 +156,14 @@ class InteractionController:
 
         :return: True if mode was restored, False otherwise
         """
-        if not self._mode_stack:
+        if not self._mode_stack_top:
             logger.warning("Cannot pop mode: mode stack is empty")
             return False
 
-        previous_mode = self._mode_stack.pop()
+        self._mode_stack_top -= 1
+        previous_mode = InteractionMode(self._mode_stack[self._mode_stack_top])
         self.set_mode(previous_mode, record_history=False)
-        logger.debug(f"Mode popped: {previous_mode.name} (stack depth: {self.mode_stack_depth})")
+        logger.debug("Mode popped: %s (stack depth: %d)", previous_mode.name, self.mode_stack_depth)
         return True
 
     def pop_or_default(self) -> InteractionMode:
@@ -159,7 +180,7 @@ class InteractionController:
 
     def clear_history(self) -> None:
         """Clear the interaction mode history."""
-        self._mode_stack.clear()
+        self._mode_stack_top = 0
         logger.debug("Interaction mode history cleared")
 
     def add_mode_changed_callback(
@@ -172,7 +193,7 @@ class InteractionController:
         Callback signature: callback(old_mode: InteractionMode, new_mode: InteractionMode) -> None
         :param callback: Callback function
         """
-        self._on_mode_changed_callbacks.append(callback)
+        self._on_mode_changed_callbacks += (callback,)
 
     def add_mode_enter_callback(
             self, mode: InteractionMode,
@@ -183,9 +204,7 @@ class InteractionController:
         :param mode:
         :param callback:
         """
-        if mode not in self._on_mode_enter_callbacks:
-            self._on_mode_enter_callbacks[mode] = []
-        self._on_mode_enter_callbacks[mode].append(callback)
+        self._on_mode_enter_callbacks[mode] += (callback,)
 
     def add_mode_exit_callback(
             self,
@@ -197,40 +216,52 @@ class InteractionController:
         :param mode: Mode to watch
         :param callback: Callback function
         """
-        if mode not in self._on_mode_exit_callbacks:
-            self._on_mode_exit_callbacks[mode] = []
-        self._on_mode_exit_callbacks[mode].append(callback)
+        self._on_mode_exit_callbacks[mode] += (callback,)
 
     def reset(self):
         """Reset the interaction controller to default mode."""
-        self._mode_stack.clear()
+        self._mode_stack_top = 0
         self.set_mode(InteractionMode.DEFAULT, record_history=False)
         logger.debug("Interaction controller reset")
 
+    def _push_history(self, mode: InteractionMode) -> None:
+        """Push a mode onto the history stack, dropping the oldest entry when full."""
+        if self._mode_stack_top == MODE_STACK_CAPACITY:
+            logger.warning("Mode stack full (%d); dropping oldest entry", MODE_STACK_CAPACITY)
+            self._mode_stack[:-1] = self._mode_stack[1:]
+            self._mode_stack_top -= 1
+        self._mode_stack[self._mode_stack_top] = mode
+        self._mode_stack_top += 1
+
     def _notify_mode_changed(self,
                              old_mode: InteractionMode,
                              new_mode: InteractionMode) -> None:
         """Notify callbacks of mode changes."""
-        for callback in self._on_mode_changed_callbacks:
-            try:
-                callback(old_mode, new_mode)
-            except Exception as e:
-                logging.exception(f"Error in mode changed callback: {e}")
+        self._dispatch(self._on_mode_changed_callbacks, "mode changed", old_mode, new_mode)
 
     def _trigger_mode_enter(self, mode: InteractionMode) -> None:
         """Trigger callbacks for entering a specific mode."""
-        callbacks = self._on_mode_enter_callbacks.get(mode, [])
-        for callback in callbacks:
-            try:
-                callback()
-            except Exception as e:
-                logging.exception(f"Error in mode enter callback: {e}")
+        self._dispatch(self._on_mode_enter_callbacks[mode], "mode enter")
 
     def _trigger_mode_exit(self, mode: InteractionMode) -> None:
         """Trigger callbacks for exiting a specific mode."""
-        callbacks = self._on_mode_exit_callbacks.get(mode, [])
-        for callback in callbacks:
+        self._dispatch(self._on_mode_exit_callbacks[mode], "mode exit")
+
+    @staticmethod
+    def _dispatch(callbacks: tuple[Callable[..., None], ...], kind: str, *args) -> None:
+        """
+        Call every callback with ``args``.
+
+        A failing callback is logged and the remaining ones still run; the
+        try block is only re-entered after an exception.
+        """
+        if not callbacks:
+            return
+        remaining = iter(enumerate(callbacks))
+        while True:
             try:
-                callback()
-            except Exception as e:
-                logging.exception(f"Error in mode exit callback: {e}")
\ No newline at end of file
+                for index, callback in remaining:
+                    callback(*args)
+                return
+            except Exception:
+                logging.exception("Error in %s callback #%d", kind, index)
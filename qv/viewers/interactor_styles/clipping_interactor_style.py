@@ -37,6 +37,21 @@ class ClippingInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
 
         logger.debug("[ClippingInteractorStyle] Initialized.")
 
+    def set_pick_target(self, prop: vtk.vtkProp | None) -> None:
+        """
+        Restrict picking to a single prop (typically the volume).
+
+        Skips the ray-cast through the clipper outline and other decoration
+        actors that a clip pick should never hit. Pass None to pick from the
+        whole scene again.
+        """
+        self.picker.InitializePickList()
+        if prop is None:
+            self.picker.PickFromListOff()
+            return
+        self.picker.AddPickList(prop)
+        self.picker.PickFromListOn()
+
     def OnLeftButtonDown(self, caller, event):
         """
         Handle left mouse button press.
@@ -48,8 +63,9 @@ class ClippingInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
         self.picker.Pick(x, y, 0, self.renderer)
         world_pt = self.picker.GetPickPosition()
 
-        logger.debug("[ClippingInteractorStyle] Point added at screen (%d, %d) -> world %s",
-                     x, y, world_pt)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[ClippingInteractorStyle] Point added at screen (%d, %d) -> world %s",
+                         x, y, world_pt)
         self.clipping_operation.add_selection_point(
             display_xy=(float(x), float(y)),
             world_pt=world_pt
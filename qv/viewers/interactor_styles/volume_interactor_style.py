@@ -1,16 +1,32 @@
 import time
+from enum import IntEnum
+
 from qv.utils.log_util import log_kpi
 
 from vtkmodules.vtkInteractionStyle import vtkInteractorStyleTrackballCamera
 
 
+class DragMode(IntEnum):
+    """Active mouse-drag mode. NONE is falsy so it can be tested directly."""
+    NONE = 0
+    SPIN = 1
+    ROTATE = 2
+    WWWL = 3
+
 
 class VolumeViewerInteractorStyle(vtkInteractorStyleTrackballCamera):
     def __init__(self, parent=None):
         super().__init__()
         self.parent = parent
-        self._last_pos = None
-        self._mode = None  # rotate の状態変数
+        self._mode = DragMode.NONE  # rotate の状態変数
+        self._iren = None
+        # Delta handlers per drag mode, resolved once instead of per event.
+        self._handlers = {}
+        if parent is not None:
+            self._handlers = {
+                DragMode.ROTATE: parent.rotate_camera,
+                DragMode.WWWL: parent.adjust_window_settings,
+            }
         self._interactive_active = False
         self._interact_start: float | None = None
         self._frame_count: int = 0
@@ -43,53 +59,48 @@ class VolumeViewerInteractorStyle(vtkInteractorStyleTrackballCamera):
             self.parent.apply_interactive_quality(active)
 
     def on_left_button_down(self, obj, event):
-        iren = self.GetInteractor()
+        iren = self._iren = self.GetInteractor()
         self._set_interaction_active(True)
 
         if iren.GetShiftKey():
             self.StartSpin()
-            self._mode = 'spin'
+            self._mode = DragMode.SPIN
         else:
-            self._mode = 'rotate'
-            self._last_pos = iren.GetEventPosition()
+            self._mode = DragMode.ROTATE
         return
 
     def on_right_button_down(self, obj, event):
-        iren = self.GetInteractor()
+        self._iren = self.GetInteractor()
         self._set_interaction_active(True)
-        self._last_pos = iren.GetEventPosition()
-        self._mode = 'ww/wl'
+        self._mode = DragMode.WWWL
 
     def on_mouse_move(self, obj, event):
+        mode = self._mode
+        if not mode:
+            return
+
         if self._interactive_active:
             self._frame_count += 1
 
-        if self._mode == 'spin':
+        if mode is DragMode.SPIN:
             self.Spin()
-        elif self._mode == 'rotate':
-            iren = self.GetInteractor()
-            x, y = iren.GetEventPosition()
-            lx, ly = self._last_pos
-            dx, dy = x - lx, y - ly
-            self.parent.rotate_camera(dx, dy)
-            self._last_pos = (x, y)
-        elif self._mode == 'ww/wl':
-            iren = self.GetInteractor()
-            x, y = iren.GetEventPosition()
-            lx, ly = self._last_pos
-            dx, dy = x - lx, y - ly
-            self.parent.adjust_window_settings(dx, dy)
-            self._last_pos = (x, y)
-        # return
+            return
+
+        # The interactor already tracks the previous event position, as the
+        # built-in VTK styles rely on, so no per-event bookkeeping is needed.
+        iren = self._iren
+        x, y = iren.GetEventPosition()
+        lx, ly = iren.GetLastEventPosition()
+        self._handlers[mode](x - lx, y - ly)
 
     def on_left_button_up(self, obj, event):
-        if self._mode == 'spin':
+        if self._mode is DragMode.SPIN:
             self.EndSpin()
-        self._mode = False
+        self._mode = DragMode.NONE
         self._set_interaction_active(False)
         return
 
     def on_right_button_up(self, obj, event):
-        self._mode = False
+        self._mode = DragMode.NONE
         self._set_interaction_active(False)
         return
\ No newline at end of file
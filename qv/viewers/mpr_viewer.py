@@ -135,7 +135,7 @@ class MprViewer(BaseViewer):
 
         self.delta_per_pixel: float = 1.0
 
-        super().__init__(settings_manager, parent)
+        super().__init__(settings_manager, parent, enable_overlay=True)
         self.vtk_widget.installEventFilter(self)
 
         self._init_plane_overlay()
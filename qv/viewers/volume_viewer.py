@@ -4,18 +4,15 @@ import math
 import time
 import zlib
 from typing import Sequence
-from collections import OrderedDict
 
 import numpy as np
 import vtk
 from PySide6 import QtCore
 from PySide6.QtCore import QEvent
-from fontTools.colorLib import geometry
-from vtkmodules.util.numpy_support import vtk_to_numpy, numpy_to_vtk
+from vtkmodules.util.numpy_support import vtk_to_numpy
 
 import qv.utils.vtk_helpers as vtk_helpers
 from qv.app.app_settings_manager import AppSettingsManager
-from qv.core import geometry_utils
 from qv.core.window_settings import WindowSettings
 from qv.core.patient_geometry import PatientFrame
 from qv.utils.log_util import log_io, log_kpi
@@ -24,14 +21,155 @@ from qv.viewers.interactor_styles.clipping_interactor_style import ClippingInter
 from qv.viewers.base_viewer import BaseViewer
 from qv.viewers.interactor_styles.volume_interactor_style import VolumeViewerInteractorStyle
 
-from vtkmodules.vtkCommonDataModel import vtkImplicitSelectionLoop
-
 from qv.core.history import Command, HistoryManager
 from qv.core.states import ClippingState
 from qv.viewers.performance_profile import PerformanceProfile, get_profile
 
 logger = logging.getLogger(__name__)
 
+_DBLCLICK = QEvent.Type.MouseButtonDblClick
+
+
+def _bounds_diagonal(bounds: Sequence[float]) -> float:
+    """Return the diagonal length of (xmin, xmax, ymin, ymax, zmin, zmax) bounds."""
+    return math.hypot(bounds[1] - bounds[0], bounds[3] - bounds[2], bounds[5] - bounds[4])
+
+
+def _offset_towards(pts: np.ndarray, target: np.ndarray, offset: float) -> np.ndarray:
+    """
+    Move each (N, 3) point ``offset`` units towards ``target``.
+
+    Points that coincide with the target are returned unchanged.
+    """
+    out = target - pts
+    lengths = np.sqrt(np.einsum("ij,ij->i", out, out))
+    scale = np.divide(offset, lengths, out=np.zeros_like(lengths), where=lengths > 0)
+    out *= scale[:, None]
+    out += pts
+    return out
+
+
+def _fill_cell_array(cells: vtk.vtkCellArray, connectivity: np.ndarray, cell_size: int,
+                     ids: np.ndarray) -> None:
+    """
+    Refill ``cells`` in place with fixed-size cells from a flat point-id array.
+
+    :param ids: Ascending 0..k id buffer with at least n_cells + 1 entries,
+        used to write the offsets without a temporary array.
+    """
+    n_cells = len(connectivity) // cell_size
+    offsets_arr = cells.GetOffsetsArray()
+    conn_arr = cells.GetConnectivityArray()
+    offsets_arr.SetNumberOfValues(n_cells + 1)
+    conn_arr.SetNumberOfValues(len(connectivity))
+    np.multiply(ids[:n_cells + 1], cell_size, out=vtk_to_numpy(offsets_arr))
+    if len(connectivity):
+        vtk_to_numpy(conn_arr)[:] = connectivity
+    offsets_arr.Modified()
+    conn_arr.Modified()
+    cells.Modified()
+
+
+def _constant_uint8_image(like: vtk.vtkImageData, value: int,
+                          extent: Sequence[int] | None = None) -> vtk.vtkImageData:
+    """
+    Return a uint8 image on the grid of ``like`` with every voxel set to ``value``.
+
+    :param extent: Sub-extent to allocate instead of the full extent of ``like``
+    """
+    image = vtk.vtkImageData()
+    image.CopyStructure(like)
+    if extent is not None:
+        image.SetExtent(*extent)
+    image.AllocateScalars(vtk.VTK_UNSIGNED_CHAR, 1)
+    vtk_to_numpy(image.GetPointData().GetScalars()).fill(value)
+    return image
+
+
+def _world_box_extent(image: vtk.vtkImageData, lo: np.ndarray, hi: np.ndarray,
+                      inclusive: bool = True) -> tuple[int, ...]:
+    """
+    Return the sub-extent of ``image`` whose voxel centres fall in [lo, hi].
+
+    With ``inclusive`` the range is widened to whole voxels touching the box.
+    The result is clipped to the image extent. An empty axis comes back as
+    max == min - 1, so the extent always has non-negative dimensions.
+    """
+    origin = np.asarray(image.GetOrigin(), dtype=np.float64)
+    spacing = np.asarray(image.GetSpacing(), dtype=np.float64)
+    extent = image.GetExtent()
+    first = (lo - origin) / spacing
+    last = (hi - origin) / spacing
+    if inclusive:
+        first, last = np.floor(first), np.ceil(last)
+    else:
+        first, last = np.ceil(first), np.floor(last)
+    out: list[int] = []
+    for a in range(3):
+        lo_a = int(max(first[a], extent[2 * a]))
+        out += [lo_a, max(int(min(last[a], extent[2 * a + 1])), lo_a - 1)]
+    return tuple(out)
+
+
+def _axis_aligned_box_extent(image: vtk.vtkImageData, world_pts: np.ndarray,
+                             view_dir: Sequence[float]) -> tuple[int, ...] | None:
+    """
+    Return the sub-extent covered by an axis-aligned rectangle extruded straight
+    down an image axis, or None for any other polygon or view.
+
+    In that case the prism is a box of whole voxel rows and needs no stencil.
+    """
+    axis = int(np.argmax(np.abs(view_dir)))
+    if abs(view_dir[axis]) < 0.999 or len(world_pts) != 4:
+        return None
+    direction = image.GetDirectionMatrix()
+    if direction is not None and not direction.IsIdentity():
+        return None
+
+    pts = world_pts
+    edges = np.roll(pts, -1, axis=0) - pts
+    in_plane = [a for a in range(3) if a != axis]
+    lengths = np.linalg.norm(edges, axis=1)
+    if not np.all(lengths > 0.0):
+        return None
+    # Every edge must run along one of the two in-plane axes.
+    cross = np.min(np.abs(edges[:, in_plane]), axis=1)
+    if np.any(cross > 1e-3 * lengths):
+        return None
+
+    lo = pts.min(axis=0)
+    hi = pts.max(axis=0)
+    # The extrusion runs through the whole volume along the view axis.
+    lo[axis], hi[axis] = -np.inf, np.inf
+    return _world_box_extent(image, lo, hi, inclusive=False)
+
+
+class _DicomLoadSignals(QtCore.QObject):
+    """Signals used by _DicomLoadTask to report back to the GUI thread."""
+    finished = QtCore.Signal(int, object)  # generation, vtkImageData
+    failed = QtCore.Signal(int, str, str)  # generation, directory, message
+
+
+class _DicomLoadTask(QtCore.QRunnable):
+    """Read a DICOM series on a worker thread."""
+
+    def __init__(self, dicom_dir: str, generation: int) -> None:
+        super().__init__()
+        self.dicom_dir = dicom_dir
+        self.generation = generation
+        self.signals = _DicomLoadSignals()
+
+    def run(self) -> None:
+        try:
+            image = vtk_helpers.narrow_to_16bit_scalars(
+                vtk_helpers.load_dicom_series(self.dicom_dir)
+            )
+        except Exception as e:
+            logger.exception("DICOM read failed: %s", self.dicom_dir)
+            self.signals.failed.emit(self.generation, self.dicom_dir, str(e))
+            return
+        self.signals.finished.emit(self.generation, image)
+
 
 class VolumeViewer(BaseViewer):
     """
@@ -44,6 +182,12 @@ class VolumeViewer(BaseViewer):
     - Zoom operations specific to volume bounds
     """
 
+    # The main window shows this viewer's camera angles.
+    TRACK_CAMERA_ANGLE = True
+
+    loadStarted = QtCore.Signal(str)
+    loadFailed = QtCore.Signal(str)
+
     def __init__(self,
                  settings_manager: AppSettingsManager | None = None,
                  parent=None) -> None:
@@ -61,10 +205,37 @@ class VolumeViewer(BaseViewer):
         self.scalar_range: tuple[float, float] | None = None
         self.color_func: vtk.vtkColorTransferFunction | None = None
         self.opacity_func: vtk.vtkPiecewiseFunction | None = None
+        # Window range last written into the transfer functions.
+        self._last_tf_range: tuple[float, float] | None = None
+        # Transfer-function nodes: clipped voxels, window min, window max.
+        # Rows are (x, r, g, b) and (x, opacity); only x of rows 1-2 changes.
+        self._tf_color_nodes = np.array(
+            [[CLIPPED_SCALAR, 0.0, 0.0, 0.0],
+             [0.0, 0.0, 0.0, 0.0],
+             [0.0, 1.0, 1.0, 1.0]],
+            dtype=np.float64,
+        )
+        self._tf_opacity_nodes = np.array(
+            [[CLIPPED_SCALAR, 0.0],
+             [0.0, 0.0],
+             [0.0, 1.0]],
+            dtype=np.float64,
+        )
         self.mask_image: vtk.vtkImageData | None = None
 
         self._patient_frame: PatientFrame | None = None
 
+        # Background loading; results from superseded loads are dropped.
+        self._load_generation: int = 0
+
+        # Volume geometry, cleared whenever the volume prop is modified.
+        self._bounds_cache: tuple[float, ...] | None = None
+        self._center_cache: tuple[float, float, float] | None = None
+        self._max_dim_cache: float | None = None
+        # Signal objects of every in-flight load, keyed by generation; each is
+        # released by its own finished/failed slot.
+        self._pending_load_signals: dict[int, _DicomLoadSignals] = {}
+
         # Window/level attributes
         self.delta_per_pixel: float = 1.0
 
@@ -75,18 +246,12 @@ class VolumeViewer(BaseViewer):
         self.clipping_state: ClippingState = ClippingState.default()
         self.history: HistoryManager = HistoryManager(max_undo=10)
 
-        self._clipping_result_cache: OrderedDict[ClippingState, vtk.vtkImageData] = OrderedDict()
-        self._clipping_result_cache_max = 3
-
-        # Cumulative mask image (uint8, 0=keep, 255=hide)
+        # Cumulative mask image (uint8, 255=keep, 0=hide)
         self._clip_mask_image: vtk.vtkImageData | None = None
+        # CPU masking filter, only used when the mapper has no mask input.
         self._masker: vtk.vtkImageMask | None = None
-
-        # Keep reference to pipeline objects to avoid premature GC.
-        # Some VTK pipelines can break if intermediate objects are garbage collected.
-        self._clipping_loop: vtkImplicitSelectionLoop | None = None
-        self._clipping_stenciler: vtk.vtkImplicitFunctionToImageStencil | None = None
-        self._clipping_image_stencil: vtk.vtkImageStencil | None = None
+        # Compressed payload the mask buffer currently holds, None once edited.
+        self._mask_zlib_in_buffer: bytes | None = None
 
         # Clipping operation and visualization
         self.clipping_operation: ClippingOperation | None = None
@@ -95,12 +260,20 @@ class VolumeViewer(BaseViewer):
         self.clipper_polydata = vtk.vtkPolyData()
         self.clipper_mapper = vtk.vtkPolyDataMapper()
         self.preview_extrude_actor: vtk.vtkActor | None = None
+        # (bounds, diagonal) used to size the clipper outline offset.
+        self._clipper_diag_cache: tuple[tuple[float, ...], float] | None = None
+        # (view angle, tan(view angle / 2)) for _set_camera_parallel_from_current.
+        self._half_tan_cache: tuple[float, float | None] | None = None
+        # ((camera MTime, aspect), (view -> world matrix, unit view direction)).
+        self._view_transform_cache: tuple[tuple[int, float], tuple[np.ndarray, np.ndarray]] | None = None
         self._opengl_info_logged = False
 
         # Performance profile state
         self._performance_profile: PerformanceProfile = get_profile("quality")
         self._interactive_quality_enabled: bool = False
 
+        # The overlay layer only carries the region selection, so it is
+        # attached in enter_clip_mode() and detached in exit_clip_mode().
         super().__init__(settings_manager=settings_manager, parent=parent)
         self.vtk_widget.installEventFilter(self)
         self._setup_clipping()
@@ -119,23 +292,19 @@ class VolumeViewer(BaseViewer):
         if self._source_image is None or self.volume is None:
             return
 
-        # Create zero mask (all visible)
-        mask = vtk.vtkImageData()
-        mask.DeepCopy(self._source_image)
-        mask.GetPointData().SetScalars(None)
-
-        ones = vtk.vtkImageThreshold()
-        ones.SetInputData(self._source_image)
-        ones.ReplaceInOn()
-        ones.ReplaceOutOn()
-        ones.ThresholdBetween(-1e38, 1e38)
-        ones.SetInValue(255)
-        ones.SetOutValue(255)
-        ones.SetOutputScalarTypeToUnsignedChar()
-        ones.Update()
+        # All-255 mask (everything visible)
+        self._clip_mask_image = _constant_uint8_image(self._source_image, 255)
+        self._mask_zlib_in_buffer = None
 
-        self._clip_mask_image = vtk.vtkImageData()
-        self._clip_mask_image.ShallowCopy(ones.GetOutput())
+        mapper = self.volume.GetMapper()
+        if hasattr(mapper, "SetMaskInput"):
+            # The GPU mapper skips voxels whose mask is 0 in the shader, so the
+            # source texture stays resident and only the mask is re-uploaded.
+            self._masker = None
+            mapper.SetMaskInput(self._clip_mask_image)
+            mapper.SetMaskTypeToBinary()
+            mapper.Modified()
+            return
 
         # Create masker pipeline once
         self._masker = vtk.vtkImageMask()
@@ -144,7 +313,6 @@ class VolumeViewer(BaseViewer):
         self._masker.SetMaskedOutputValue(CLIPPED_SCALAR)
         self._masker.Update()
 
-        mapper = self.volume.GetMapper()
         mapper.SetInputConnection(self._masker.GetOutputPort())
         mapper.Modified()
 
@@ -161,9 +329,26 @@ class VolumeViewer(BaseViewer):
             renderer=self.renderer,
             clipping_operation=self.clipping_operation)
 
+        # Outline arrays are attached once and refilled on every redraw.
+        self._clip_points = vtk.vtkPoints()
+        self._clip_points.SetDataTypeToDouble()
+        self._clip_verts = vtk.vtkCellArray()
+        self._clip_lines = vtk.vtkCellArray()
+        self._clip_ids = np.arange(0, dtype=np.int64)
+        self._clip_line_conn = np.empty(0, dtype=np.int64)
+        # (point bytes, camera position, offset) of the outline currently shown.
+        self._last_clip_key: tuple | None = None
+        # Point count the vert/line cells were last built for; they depend on nothing else.
+        self._clip_cells_n = 0
+        self.clipper_polydata.SetPoints(self._clip_points)
+        self.clipper_polydata.SetVerts(self._clip_verts)
+        self.clipper_polydata.SetLines(self._clip_lines)
+
         self.clipper_mapper.SetInputData(self.clipper_polydata)
         self.clipper_actor.SetMapper(self.clipper_mapper)
 
+        self._init_clip_stencil_pipeline()
+
         # Configure clipper visual properties
         prop = self.clipper_actor.GetProperty()
         prop.SetColor(1, 1, 0)
@@ -184,11 +369,14 @@ class VolumeViewer(BaseViewer):
 
     def eventFilter(self, obj, event):
         """Handle double-click events on VTK widgets."""
-        if obj == self.vtk_widget:
-            if event.type() == QEvent.MouseButtonDblClick:
-                logger.debug("Mouse double click event detected ->  LeftButtonDoubleClickEvent")
-                self.interactor.InvokeEvent("LeftButtonDoubleClickEvent")
-                return True
+        # Every mouse move passes through here; bail out on the type first.
+        # QWidget's own eventFilter only returns False, so skip calling it.
+        if event.type() != _DBLCLICK:
+            return False
+        if obj is self.vtk_widget:
+            logger.debug("Mouse double click event detected ->  LeftButtonDoubleClickEvent")
+            self.interactor.InvokeEvent("LeftButtonDoubleClickEvent")
+            return True
         return super().eventFilter(obj, event)
 
     # =====================================================
@@ -241,7 +429,7 @@ class VolumeViewer(BaseViewer):
         de = -dy * rotation_factor
 
         self.camera_controller.rotate(da, de)
-        self.update_view()
+        self.request_render()
 
     # =====================================================
     # Volume-specific Utility Method
@@ -257,13 +445,14 @@ class VolumeViewer(BaseViewer):
         if self.volume is None:
             raise RuntimeError("Volume not loaded")
 
-        bounds = self.volume.GetBounds()
-        center = (
-            0.5 * (bounds[0] + bounds[1]),
-            0.5 * (bounds[2] + bounds[3]),
-            0.5 * (bounds[4] + bounds[5]),
-        )
-        return center
+        if self._center_cache is None:
+            bounds = self._volume_bounds()
+            self._center_cache = (
+                0.5 * (bounds[0] + bounds[1]),
+                0.5 * (bounds[2] + bounds[3]),
+                0.5 * (bounds[4] + bounds[5]),
+            )
+        return self._center_cache
 
     def get_default_distance(self) -> float:
         """
@@ -275,13 +464,26 @@ class VolumeViewer(BaseViewer):
         if self.volume is None:
             raise RuntimeError("Volume not loaded")
 
-        bounds = self.volume.GetBounds()
-        max_dim = max(
-            bounds[1] - bounds[0],
-            bounds[3] - bounds[2],
-            bounds[5] - bounds[4]
-        )
-        return max_dim * 2.0
+        if self._max_dim_cache is None:
+            bounds = self._volume_bounds()
+            self._max_dim_cache = max(
+                bounds[1] - bounds[0],
+                bounds[3] - bounds[2],
+                bounds[5] - bounds[4]
+            )
+        return self._max_dim_cache * 2.0
+
+    def _volume_bounds(self) -> tuple[float, float, float, float, float, float]:
+        """Return the (cached) bounds of the loaded volume."""
+        if self._bounds_cache is None:
+            self._bounds_cache = self.volume.GetBounds()
+        return self._bounds_cache
+
+    def _invalidate_volume_caches(self, obj=None, event=None) -> None:
+        """Drop cached volume geometry (also the vtkVolume ModifiedEvent observer)."""
+        self._bounds_cache = None
+        self._center_cache = None
+        self._max_dim_cache = None
 
     # =====================================================
     # Data Loading
@@ -290,23 +492,77 @@ class VolumeViewer(BaseViewer):
     @log_io(level=logging.INFO)
     def load_data(self, dicom_dir: str) -> None:
         """
-        Load a volume from a DICOM directory.
+        Load a volume from a DICOM directory without blocking the UI.
 
         :param dicom_dir: Path to a directory containing DICOM files
         """
-        self.load_volume(dicom_dir)
+        self.load_volume_async(dicom_dir)
+
+    def load_volume_async(self, dicom_dir: str) -> None:
+        """
+        Read a DICOM series on the global thread pool and display it when done.
+
+        Emits loadStarted immediately and dataLoaded (or loadFailed) later on
+        the GUI thread. Only the most recent request is displayed.
+
+        :param dicom_dir: Path to a directory containing DICOM files
+        """
+        logger.info("Loading volume from %s (background)", dicom_dir)
+        self._load_start_t = time.perf_counter()
+        self._first_time_logged = False
+        self._load_generation += 1
+
+        task = _DicomLoadTask(dicom_dir, self._load_generation)
+        # Queued explicitly: the pipeline must be built on the GUI thread even
+        # if the task happens to run synchronously.
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        task.signals.finished.connect(self._on_volume_read, queued)
+        task.signals.failed.connect(self._on_volume_read_failed, queued)
+        # The pool deletes the task once it has run; keep its signal object
+        # alive until the queued result has been delivered.
+        self._pending_load_signals[self._load_generation] = task.signals
+
+        self.loadStarted.emit(dicom_dir)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _on_volume_read(self, generation: int, image: vtk.vtkImageData) -> None:
+        """Display a volume read by _DicomLoadTask, unless a newer load superseded it."""
+        self._pending_load_signals.pop(generation, None)
+        if generation != self._load_generation:
+            return
+        self._show_volume(image)
+
+    def _on_volume_read_failed(self, generation: int, dicom_dir: str, message: str) -> None:
+        """Report a failed background read."""
+        self._pending_load_signals.pop(generation, None)
+        if generation != self._load_generation:
+            return
+        logger.error("Failed to load volume from %s: %s", dicom_dir, message)
+        self.loadFailed.emit(message)
 
     def load_volume(self, dicon_dir: str) -> None:
         """
-        Load a volume from a DICOM directory.
+        Load a volume from a DICOM directory synchronously.
 
         :param dicon_dir: Path to a directory containing DICOM files
         """
         logger.info(f"Loading volume from {dicon_dir}")
         self._load_start_t = time.perf_counter()
         self._first_time_logged = False
+        # Supersede any background load still in flight.
+        self._load_generation += 1
+
+        self._show_volume(
+            vtk_helpers.narrow_to_16bit_scalars(vtk_helpers.load_dicom_series(dicon_dir))
+        )
+
+    def _show_volume(self, image: vtk.vtkImageData) -> None:
+        """
+        Build the rendering pipeline for a loaded image. GUI thread only.
 
-        self._source_image = vtk_helpers.load_dicom_series(dicon_dir)
+        :param image: Loaded DICOM volume
+        """
+        self._source_image = image
         self.scalar_range = self._source_image.GetScalarRange()
 
         min_scalar, max_scalar = self.scalar_range
@@ -317,6 +573,7 @@ class VolumeViewer(BaseViewer):
 
         self.color_func = vtk.vtkColorTransferFunction()
         self.opacity_func = vtk.vtkPiecewiseFunction()
+        self._last_tf_range = None
 
         self.volume_property = vtk.vtkVolumeProperty()
         self.volume_property.SetColor(self.color_func)
@@ -352,6 +609,7 @@ class VolumeViewer(BaseViewer):
             )
             mapper = vtk.vtkSmartVolumeMapper()
             mapper.SetRequestedRenderModeToDefault()
+            mapper.InteractiveAdjustSampleDistancesOn()
         if hasattr(mapper, "AutoAdjustSampleDistancesOn"):
             mapper.AutoAdjustSampleDistancesOn()
         mapper.SetInputData(self._source_image)
@@ -359,6 +617,10 @@ class VolumeViewer(BaseViewer):
         self.volume = vtk.vtkVolume()
         self.volume.SetMapper(mapper)
         self.volume.SetProperty(self.volume_property)
+        self._invalidate_volume_caches()
+        self.volume.AddObserver(vtk.vtkCommand.ModifiedEvent, self._invalidate_volume_caches)
+        if self._clipping_interactor_style is not None:
+            self._clipping_interactor_style.set_pick_target(self.volume)
 
         self.set_profile(self._performance_profile)
 
@@ -375,9 +637,7 @@ class VolumeViewer(BaseViewer):
                 self._clip_mask_image.GetScalarTypeAsString(),
             )
 
-        if self._masker is None:
-            logger.warning("[VolumeViewer] Failed to initialize clipping masker.")
-        else:
+        if self._masker is not None:
             out = self._masker.GetOutput()
             if out is not None:
                 logger.info(
@@ -387,18 +647,20 @@ class VolumeViewer(BaseViewer):
                 )
 
         self.camera_controller.set_patient_frame(self.volume)
-        self.camera_controller.reset_to_bounds(self.volume.GetBounds(), view='front')
+        self.camera_controller.reset_to_bounds(self._volume_bounds(), view='front')
         self._set_camera_parallel_from_current()
 
-        self.set_window_settings(initial_window_settings, render=False)
-
-        self.update_view()
-        self._log_opengl_info_once()
         self.vtk_widget.GetRenderWindow().AddObserver("EndEvent", self._on_render_end)
 
-        # Reset history and clipping state when data changes (spec requirement)
-        self.history.clear()
-        self.set_clipping_state(ClippingState.default())
+        # The first frame is drawn once, after WW/WL and the clipping reset.
+        with self._batched():
+            self.set_window_settings(initial_window_settings, render=False)
+
+            # Reset history and clipping state when data changes (spec requirement)
+            self.history.clear()
+            self.set_clipping_state(ClippingState.default())
+            self.update_view()
+        self._log_opengl_info_once()
 
         self.dataLoaded.emit()
 
@@ -533,8 +795,18 @@ class VolumeViewer(BaseViewer):
         self._interactive_quality_enabled = bool(enabled)
         self._apply_profile(interactive=self._interactive_quality_enabled)
 
+        # 独自スタイルは StartInteraction を呼ばないため、自動サンプル距離調整の
+        # 目標フレームレートをここで切り替える
+        if self.interactor is not None:
+            render_window = self.vtk_widget.GetRenderWindow()
+            if self._interactive_quality_enabled:
+                rate = self.interactor.GetDesiredUpdateRate()
+            else:
+                rate = self.interactor.GetStillUpdateRate()
+            render_window.SetDesiredUpdateRate(rate)
+
         QtCore.QTimer.singleShot(0, self.update_view)
-        logger.debug(f"Interactive quality applied: {enabled}")
+        logger.debug("Interactive quality applied: %s", enabled)
 
     def _on_render_end(self, obj, event) -> None:
         """初回レンダリング完了時に first_frame_ms に記録する"""
@@ -595,15 +867,25 @@ class VolumeViewer(BaseViewer):
 
         min_val, max_val = settings.get_range()
 
-        self.color_func.RemoveAllPoints()
-        self.color_func.AddRGBPoint(CLIPPED_SCALAR, 0.0, 0.0, 0.0)
-        self.color_func.AddRGBPoint(min_val, 0.0, 0.0, 0.0)
-        self.color_func.AddRGBPoint(max_val, 1.0, 1.0, 1.0)
-
-        self.opacity_func.RemoveAllPoints()
-        self.opacity_func.AddPoint(CLIPPED_SCALAR, 0.0)
-        self.opacity_func.AddPoint(min_val, 0.0)
-        self.opacity_func.AddPoint(max_val, 1.0)
+        # Sub-HU changes (typical of slow WW/WL drags) would only invalidate
+        # the GPU transfer-function textures without a visible difference.
+        # The HUD text has changed regardless, so a redraw is still needed.
+        last = self._last_tf_range
+        if last is not None and abs(min_val - last[0]) < 0.5 and abs(max_val - last[1]) < 0.5:
+            return True
+        self._last_tf_range = (min_val, max_val)
+
+        # Only the window endpoints change; refill both functions in one call
+        # each (FillFromDataPointer clears the previous points itself).
+        color_nodes = self._tf_color_nodes
+        color_nodes[1, 0] = min_val
+        color_nodes[2, 0] = max_val
+        self.color_func.FillFromDataPointer(3, color_nodes.ravel())
+
+        opacity_nodes = self._tf_opacity_nodes
+        opacity_nodes[1, 0] = min_val
+        opacity_nodes[2, 0] = max_val
+        self.opacity_func.FillFromDataPointer(3, opacity_nodes.ravel())
 
         return True
 
@@ -617,9 +899,10 @@ class VolumeViewer(BaseViewer):
         if settings is None:
             return
 
+        self._last_tf_range = None
         changed = self._apply_window_settings(settings)
         if changed:
-            self.update_view()
+            self.request_render()
 
     def set_window_settings(
             self,
@@ -666,7 +949,11 @@ class VolumeViewer(BaseViewer):
             delta_level=delta_level,
             scalar_range=self.scalar_range,
         )
-        self.set_window_settings(adjusted)
+        # Mouse drags call this per motion event; render once per loop turn.
+        with self._batched():
+            self.set_window_settings(adjusted, render=False)
+            if self._window_settings != current:
+                self.request_render()
 
     # =====================================================
     # Zoom Operations (Volume-specific)
@@ -683,7 +970,7 @@ class VolumeViewer(BaseViewer):
 
         default_distance = self.get_default_distance()
         self.camera_controller.set_zoom(factor, default_distance=default_distance)
-        self.update_view()
+        self.request_render()
 
     def set_zoom_2x(self) -> None:
         self.set_zoom_factor(2.0)
@@ -697,8 +984,7 @@ class VolumeViewer(BaseViewer):
     def reset_center(self) -> None:
         """Reset camera focal point to center."""
         center = self.get_volume_center()
-        camera = self.renderer.GetActiveCamera()
-        camera.SetFocalPoint(*center)
+        self.camera_controller.camera.SetFocalPoint(*center)
         self.update_view()
 
     # =====================================================
@@ -732,6 +1018,7 @@ class VolumeViewer(BaseViewer):
             return
 
         logger.debug("[VolumeViewer] Entering clipping mode")
+        self.set_overlay_enabled(True)
         self.interactor.SetInteractorStyle(self._clipping_interactor_style)
         logger.debug("[VolumeViewer] Switch interactor style to %s",
                      type(self.interactor.GetInteractorStyle()).__name__)
@@ -747,6 +1034,7 @@ class VolumeViewer(BaseViewer):
         self.interactor.SetInteractorStyle(self._default_interactor_style)
         logger.debug("[VolumeViewer] Switch interactor style to %s",
                      type(self.interactor.GetInteractorStyle()).__name__)
+        self.set_overlay_enabled(False)
 
     # =====================================================
     # Clipping Operations
@@ -764,7 +1052,7 @@ class VolumeViewer(BaseViewer):
             return
         if self._clip_mask_image is None:
             self._init_mask_pipeline()
-            if self._clip_mask_image is None or self._masker is None:
+            if self._clip_mask_image is None:
                 return
 
         disp_pts = list(getattr(self.clipping_operation, 'clip_points_display', []) or [])
@@ -779,21 +1067,21 @@ class VolumeViewer(BaseViewer):
         polygon_ndc = self._display_points_to_ndc(disp_pts)
         mode = getattr(self.clipping_operation, 'clip_mode', ClipMode.REMOVE_INSIDE)
 
-        region_keep_mask = self._build_keep_mask_from_polygon_ndc(polygon_ndc, mode)
-        if region_keep_mask is None:
+        region = self._build_keep_mask_from_polygon_ndc(polygon_ndc, mode)
+        if region is None:
             logger.warning("[VolumeViewer] Failed to build region hide mask.")
             self.exit_clip_mode()
             return
 
-        self._accumulate_mask_and(region_keep_mask)
+        self._accumulate_mask_and(*region)
 
-        if self._clip_mask_image is not None:
+        if self._clip_mask_image is not None and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "[VolumeViewer] mask scalar range after accumulate: %s (type=%s)",
                 self._clip_mask_image.GetScalarRange(),
                 self._clip_mask_image.GetScalarTypeAsString(),
             )
-        if self._masker is not None and self._masker.GetOutput() is not None:
+        if self._masker is not None and logger.isEnabledFor(logging.DEBUG):
             out = self._masker.GetOutput()
             logger.debug(
                 "[VolumeViewer] _masker output range after accumulate (before state save): %s (type=%s)",
@@ -804,18 +1092,24 @@ class VolumeViewer(BaseViewer):
         after = ClippingState(mask_zlib=self._compress_current_mask())
 
         logger.info("[VolumeViewer] Applying clipping state via history manager.")
-        try:
-            self.history.do(Command(before=before, after=after), self.set_clipping_state)
-        except Exception:
-            logger.exception("[VolumeViewer] Failed to apply clipping state.")
+        # Applying the state and tearing down the preview share one frame.
+        with self._batched():
+            if after == before:
+                # The polygon hid nothing new; keep no-op entries out of the history.
+                logger.info("[VolumeViewer] Clipping left the mask unchanged; not recorded.")
+            else:
+                try:
+                    self.history.do(Command(before=before, after=after), self.set_clipping_state)
+                except Exception:
+                    logger.exception("[VolumeViewer] Failed to apply clipping state.")
 
-        # Cleanup preview actors and mode state
-        self._clear_clipper_visualization()
-        try:
-            self.clipping_operation.reset()
-        except Exception:
-            logger.exception("[VolumeViewer] Failed to reset clipping operation.")
-        self.exit_clip_mode()
+            # Cleanup preview actors and mode state
+            self._clear_clipper_visualization()
+            try:
+                self.clipping_operation.reset()
+            except Exception:
+                logger.exception("[VolumeViewer] Failed to reset clipping operation.")
+            self.exit_clip_mode()
 
     def cancel_clipping(self) -> None:
         """Discard the current selection without recording any history."""
@@ -844,40 +1138,35 @@ class VolumeViewer(BaseViewer):
         if self.volume is None or self._source_image is None:
             return
 
-        if self._clip_mask_image is None or self._masker is None:
+        if self._clip_mask_image is None:
             self._init_mask_pipeline()
-            if self._clip_mask_image is None or self._masker is None:
+            if self._clip_mask_image is None:
                 return
 
         if not state.enabled:
             self._reset_mask_to_zero()
 
-            if self._clip_mask_image is not None:
+            if self._clip_mask_image is not None and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "[VolumeViewer] range after reset(default): %s (type=%s)",
                     self._clip_mask_image.GetScalarRange(),
                     self._clip_mask_image.GetScalarTypeAsString(),
                 )
-            self._masker.SetInputData(self._source_image)
-            self._masker.SetMaskInputData(self._clip_mask_image)
-            self._masker.Modified()
             self.update_view()
             return
 
         self._decompress_into_current_mask(state.mask_zlib)
 
-        if self._clip_mask_image is not None:
+        if self._clip_mask_image is not None and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "[VolumeViewer] mask range after decompress: %s (type=%s)",
                 self._clip_mask_image.GetScalarRange(),
                 self._clip_mask_image.GetScalarTypeAsString(),
             )
 
-        self._masker.SetInputData(self._source_image)
-        self._masker.SetMaskInputData(self._clip_mask_image)
-        self._masker.Modified()
-
-        if self._masker.GetOutput() is not None:
+        # The masker (or GPU mask) is bound to this image once in
+        # _init_mask_pipeline; the mask edits above already marked it modified.
+        if self._masker is not None and logger.isEnabledFor(logging.DEBUG):
             out = self._masker.GetOutput()
             logger.debug(
                 "[VolumeViewer] masker output range after state apply: %s (type=%s)",
@@ -889,24 +1178,23 @@ class VolumeViewer(BaseViewer):
     def _reset_mask_to_zero(self) -> None:
         if self._source_image is None or self._clip_mask_image is None:
             return
-        ones = vtk.vtkImageThreshold()
-        ones.SetInputData(self._source_image)
-        ones.ReplaceInOn()
-        ones.ReplaceOutOn()
-        ones.ThresholdBetween(-1e38, 1e38)
-        ones.SetInValue(255)
-        ones.SetOutValue(255)
-        ones.SetOutputScalarTypeToUnsignedChar()
-        ones.Update()
-
-        self._clip_mask_image.ShallowCopy(ones.GetOutput())
+        # Everything visible again; refill the existing buffer in place.
+        self._mask_zlib_in_buffer = None
+        scalars = self._clip_mask_image.GetPointData().GetScalars()
+        vtk_to_numpy(scalars).fill(255)
+        scalars.Modified()
         self._clip_mask_image.Modified()
 
     def _compress_current_mask(self) -> bytes | None:
         if self._clip_mask_image is None:
             return None
-        arr = vtk_to_numpy(self._clip_mask_image.GetPointData().GetScalars()).view(np.uint8)
-        return zlib.compress(arr.tobytes(), level=3)
+        arr = vtk_to_numpy(self._clip_mask_image.GetPointData().GetScalars())
+        # The mask is binary (0/255): pack 8 voxels per byte before deflating.
+        # packbits treats any non-zero as a set bit, and zlib reads the packed
+        # array through the buffer protocol, so no full-size temporary is made.
+        payload = zlib.compress(np.packbits(arr), level=3)
+        self._mask_zlib_in_buffer = payload
+        return payload
 
     def _decompress_into_current_mask(self, mask_zlib: bytes | None) -> None:
         if self._clip_mask_image is None or self._source_image is None:
@@ -914,24 +1202,57 @@ class VolumeViewer(BaseViewer):
         if mask_zlib is None:
             self._reset_mask_to_zero()
             return
+        # apply_clipping compresses the live mask and immediately applies that
+        # state; the buffer already holds it.
+        if mask_zlib is self._mask_zlib_in_buffer:
+            return
 
-        raw = zlib.decompress(mask_zlib)
-        expected = self._source_image.GetNumberOfPoints()
-        arr = np.frombuffer(raw, dtype=np.uint8, count=expected)
-
-        vtk_arr = numpy_to_vtk(arr, deep=True, array_type=vtk.VTK_UNSIGNED_CHAR)
-        self._clip_mask_image.GetPointData().SetScalars(vtk_arr)
+        # Inflate straight into the existing scalar buffer so the mask array
+        # (and the texture bound to it) keeps its identity across undo/redo.
+        scalars = self._clip_mask_image.GetPointData().GetScalars()
+        dst = vtk_to_numpy(scalars)
+        bits = np.frombuffer(zlib.decompress(mask_zlib), dtype=np.uint8)
+        np.multiply(np.unpackbits(bits, count=dst.size), 255, out=dst)
+        scalars.Modified()
         self._clip_mask_image.Modified()
+        self._mask_zlib_in_buffer = mask_zlib
+
+    def _init_clip_stencil_pipeline(self) -> None:
+        """
+        Wire the polygon -> keep-mask pipeline once.
+
+        Each apply only swaps the polygon, the extrusion vector and the output grid.
+        """
+        self._clip_polygon_points = vtk.vtkPoints()
+        self._clip_polygon_points.SetDataTypeToDouble()
+        self._clip_polygon = vtk.vtkPolyData()
+        self._clip_polygon.SetPoints(self._clip_polygon_points)
+        self._clip_polygon.SetPolys(vtk.vtkCellArray())
+        self._clip_extruder = vtk.vtkLinearExtrusionFilter()
+        self._clip_extruder.SetInputData(self._clip_polygon)
+        self._clip_extruder.SetExtrusionTypeToVectorExtrusion()
+        self._clip_extruder.CappingOn()
+        self._clip_stenciler = vtk.vtkPolyDataToImageStencil()
+        self._clip_stenciler.SetInputConnection(self._clip_extruder.GetOutputPort())
+        self._clip_stencil_image = vtk.vtkImageStencilToImage()
+        self._clip_stencil_image.SetInputConnection(self._clip_stenciler.GetOutputPort())
+        self._clip_stencil_image.SetOutputScalarTypeToUnsignedChar()
 
     def _build_keep_mask_from_polygon_ndc(
             self,
-            polygon_ndc: tuple[tuple[float, float], ...],
+            polygon_ndc: np.ndarray,
             mode: ClipMode,
-    ) -> vtk.vtkImageData | None:
+    ) -> tuple[vtk.vtkImageData, int] | None:
         """
-        Build a mask image where 255 means 'hide' and 0 means 'show'.
+        Build the keep mask (255=keep, 0=hide) for the polygon extruded along the view.
         REMOVE_INSIDE: hide inside polygon
         REMOVE_OUTSIDE: hide outside polygon
+
+        Only the bounding box of the extruded polygon is rasterised, so the
+        returned image covers a sub-extent of the source; voxels outside it
+        take the returned outside value.
+
+        :return: (region keep mask, outside value), or None
         """
         if self._source_image is None:
             return None
@@ -941,192 +1262,191 @@ class VolumeViewer(BaseViewer):
         if len(world_pts) < 3:
             return None
 
-        camera = self.renderer.GetActiveCamera()
-        fp = camera.GetFocalPoint()
-        view_vec = geometry_utils.direction_vector(camera.GetPosition(), fp)
-        norm = geometry_utils.calculate_norm(view_vec)
-        view_dir = [v / norm for v in view_vec]
-
-        vtk_points = vtk.vtkPoints()
-        for p in world_pts:
-            vtk_points.InsertNextPoint(*p)
-
-        loop = vtk.vtkImplicitSelectionLoop()
-        loop.SetLoop(vtk_points)
-        loop.SetNormal(*view_dir)
-        loop.AutomaticNormalGenerationOff()
-
-        stenciler = vtk.vtkImplicitFunctionToImageStencil()
-        stenciler.SetInput(loop)
-        stenciler.SetOutputOrigin(self._source_image.GetOrigin())
-        stenciler.SetOutputSpacing(self._source_image.GetSpacing())
-        stenciler.SetOutputWholeExtent(self._source_image.GetExtent())
-
-        ones = vtk.vtkImageThreshold()
-        ones.SetInputData(self._source_image)
-        ones.ReplaceInOn()
-        ones.ReplaceOutOn()
-        ones.ThresholdBetween(-1e38, 1e38)
-        ones.SetInValue(255)
-        ones.SetOutValue(255)
-        ones.SetOutputScalarTypeToUnsignedChar()
-        ones.Update()
-
-        img_stencil = vtk.vtkImageStencil()
-        img_stencil.SetInputData(ones.GetOutput())
-        img_stencil.SetStencilConnection(stenciler.GetOutputPort())
-        img_stencil.ReverseStencilOff()
-        img_stencil.SetBackgroundValue(0)
-
-        # Keep method
-        # ReverseStencilOff -> Keep INSIDE (inside=255, outside=0)
-        # ReverseStencilOn  -> Keep OUTSIDE (inside=0, outside=255)
+        _, view_dir = self._view_transform()
+
+        src = self._source_image
         if mode is ClipMode.REMOVE_INSIDE:
-            img_stencil.ReverseStencilOn()
+            inside_value, outside_value = 0, 255
         else:
-            img_stencil.ReverseStencilOff()
-
-        img_stencil.Update()
-
+            inside_value, outside_value = 255, 0
+
+        box = _axis_aligned_box_extent(src, world_pts, view_dir)
+        if box is not None:
+            return _constant_uint8_image(src, inside_value, box), outside_value
+
+        # Extrude the planar polygon along the view direction into a closed
+        # prism through the whole volume. vtkPolyDataToImageStencil rasterises
+        # it slice by slice, which is far cheaper than evaluating an implicit
+        # point-in-loop test at every voxel.
+        reach = 2.0 * (_bounds_diagonal(src.GetBounds()) or 1.0)
+        start_pts = world_pts - reach * np.asarray(view_dir)
+
+        n = len(start_pts)
+        self._clip_polygon_points.SetNumberOfPoints(n)
+        vtk_to_numpy(self._clip_polygon_points.GetData())[:] = start_pts
+        self._clip_polygon_points.Modified()
+        cap = self._clip_polygon.GetPolys()
+        cap.Reset()
+        cap.InsertNextCell(n, list(range(n)))
+        self._clip_polygon.Modified()
+
+        self._clip_extruder.SetVector(*view_dir)
+        self._clip_extruder.SetScaleFactor(2.0 * reach)
+
+        # Rasterise only where the prism meets the volume.
+        end_pts = start_pts + 2.0 * reach * np.asarray(view_dir)
+        prism = np.vstack((start_pts, end_pts))
+        sub_extent = _world_box_extent(src, prism.min(axis=0), prism.max(axis=0))
+        if any(sub_extent[2 * a + 1] < sub_extent[2 * a] for a in range(3)):
+            return _constant_uint8_image(src, outside_value, sub_extent), outside_value
+
+        stenciler = self._clip_stenciler
+        stenciler.SetOutputOrigin(src.GetOrigin())
+        stenciler.SetOutputSpacing(src.GetSpacing())
+        stenciler.SetOutputWholeExtent(sub_extent)
+
+        to_image = self._clip_stencil_image
+        to_image.SetInsideValue(inside_value)
+        to_image.SetOutsideValue(outside_value)
+        to_image.Update()
+
+        # Shares the pipeline output buffer: valid until the next call, which
+        # callers never outlive (the mask is folded into the history mask).
         keep_mask = vtk.vtkImageData()
-        keep_mask.ShallowCopy(img_stencil.GetOutput())
-        return keep_mask
+        keep_mask.ShallowCopy(to_image.GetOutput())
+        return keep_mask, outside_value
 
-    def _accumulate_mask_and(self, region_hide_mask: vtk.vtkImageData) -> None:
-        """current_mask = max(current_mask, region_hide_mask)"""
+    def _accumulate_mask_and(self, region_keep_mask: vtk.vtkImageData, outside_value: int) -> None:
+        """
+        current_mask = min(current_mask, region_keep_mask), in place.
+
+        Voxels outside the region's extent are combined with ``outside_value``,
+        so a 255 outside touches only the region's box.
+        """
         if self._clip_mask_image is None:
             return
 
-        op = vtk.vtkImageMathematics()
-        op.SetInput1Data(self._clip_mask_image)
-        op.SetInput2Data(region_hide_mask)
-        op.SetOperationToMin()
-        op.Update()
-
-        self._clip_mask_image.ShallowCopy(op.GetOutput())
+        self._mask_zlib_in_buffer = None
+        scalars = self._clip_mask_image.GetPointData().GetScalars()
+        # vtkImageData stores x fastest, so the array is indexed [z, y, x].
+        current = vtk_to_numpy(scalars).reshape(self._clip_mask_image.GetDimensions()[::-1])
+        extent = self._clip_mask_image.GetExtent()
+        region_extent = region_keep_mask.GetExtent()
+        box = tuple(
+            slice(region_extent[2 * a] - extent[2 * a], region_extent[2 * a + 1] - extent[2 * a] + 1)
+            for a in (2, 1, 0)
+        )
+        view = current[box]
+        if view.size:
+            region = vtk_to_numpy(region_keep_mask.GetPointData().GetScalars())
+            np.minimum(view, region.reshape(view.shape), out=view)
+        if outside_value == 0:
+            kept = view.copy()
+            current.fill(0)
+            current[box] = kept
+        scalars.Modified()
         self._clip_mask_image.Modified()
 
-    def _get_cached_clipping_result(self, state: ClippingState) -> vtk.vtkImageData | None:
-        hit = self._clipping_result_cache.get(state)
-        if hit is None:
-            return None
-
-        self._clipping_result_cache.move_to_end(state)
-        return hit
-
-    def _put_cached_clipping_result(self, state: ClippingState, img: vtk.vtkImageData) -> None:
-        self._clipping_result_cache[state] = img
-        self._clipping_result_cache.move_to_end(state)
-        while len(self._clipping_result_cache) > self._clipping_result_cache_max:
-            self._clipping_result_cache.popitem(last=False)
-
-    def _build_clipped_image_from_state(self, state: ClippingState) -> vtk.vtkImageData | None:
-        """Build a clipped vtkImageData by applying all regions cumulatively.
-        This is expensive, so we cache the result for undo/redo speed."""
-        if self._source_image is None:
-            return None
-
-        current = vtk.vtkImageData()
-        current.DeepCopy(self._source_image)
-
-        for region in state.regions:
-            if len(region.polygon_world) < 3:
-                continue
-
-            vtk_points = vtk.vtkPoints()
-            for p in region.polygon_world:
-                vtk_points.InsertNextPoint(*p)
-
-            loop = vtk.vtkImplicitSelectionLoop()
-            loop.SetLoop(vtk_points)
-            loop.SetNormal(*region.normal_world)
-            loop.AutomaticNormalGenerationOff()
-
-            stenciler = vtk.vtkImplicitFunctionToImageStencil()
-            stenciler.SetInput(loop)
-            stenciler.SetOutputOrigin(current.GetOrigin())
-            stenciler.SetOutputSpacing(current.GetSpacing())
-            stenciler.SetOutputWholeExtent(current.GetExtent())
-
-            img_stencil = vtk.vtkImageStencil()
-            img_stencil.SetInputData(current)
-            img_stencil.SetStencilConnection(stenciler.GetOutputPort())
-            if region.mode == ClipMode.REMOVE_INSIDE:
-                img_stencil.ReverseStencilOn()
-            else:
-                img_stencil.ReverseStencilOff()
-            img_stencil.SetBackgroundValue(CLIPPED_SCALAR)
-            img_stencil.Update()
-
-            next_img = vtk.vtkImageData()
-            next_img.DeepCopy(img_stencil.GetOutput())
-            current = next_img
-
-        return current
-
-    def _drop_clipping_pipeline_refs(self) -> None:
-        """Clear the reference to the active clipping filters."""
-        self._clipping_loop = None
-        self._clipping_stenciler = None
-        self._clipping_img_stencil = None
-        self._cliping_pipelines = []
+    def _viewport_size(self) -> np.ndarray:
+        """Return the widget size as a (w, h) float array, each at least 1."""
+        size = self.vtk_widget.size()
+        return np.array(
+            (max(1, int(size.width())), max(1, int(size.height()))),
+            dtype=np.float64,
+        )
 
     def _display_points_to_ndc(
             self,
-            display_points: Sequence[tuple[float, float]],
-    ) -> tuple[tuple[float, float], ...]:
-        """Convert pixel coordinates to 0..1 range (origin bottom-left)."""
-        size = self.vtk_widget.size()
-        w = max(1, int(size.width()))
-        h = max(1, int(size.height()))
-        return tuple((float(x) / w, float(y) / h) for x, y in display_points)
+            display_points: Sequence[tuple[float, float]] | np.ndarray,
+    ) -> np.ndarray:
+        """Convert pixel coordinates to an (N, 2) array in 0..1 range (origin bottom-left)."""
+        pts = np.asarray(display_points, dtype=np.float64).reshape(-1, 2)
+        return pts / self._viewport_size()
 
     def _ndc_points_to_display(
             self,
-            ndc_points: Sequence[tuple[float, float]],
-    ) -> list[tuple[float, float]]:
-        """Restore pixel coordinates from 0..1 range (origin bottom-left)."""
-        size = self.vtk_widget.size()
-        w = max(1, int(size.width()))
-        h = max(1, int(size.height()))
-        return [(float(nx) * w, float(ny) * h) for nx, ny in ndc_points]
+            ndc_points: Sequence[tuple[float, float]] | np.ndarray,
+    ) -> np.ndarray:
+        """Restore an (N, 2) array of pixel coordinates from 0..1 range (origin bottom-left)."""
+        pts = np.asarray(ndc_points, dtype=np.float64).reshape(-1, 2)
+        return pts * self._viewport_size()
 
     def _project_display_to_center_plane(
             self,
-            display_points: Sequence[tuple[float, float]],
-    ) -> list[tuple[float, float, float]]:
+            display_points: Sequence[tuple[float, float]] | np.ndarray,
+    ) -> np.ndarray:
         """
         Project screen pixels onto a 3D plane passing through the volume's center.
         Ensures the restored world-space polygon matches the user's initial screen selection.
+
+        :return: (N, 3) float64 array of world points
         """
-        if not display_points:
-            return []
+        if len(display_points) == 0:
+            return np.empty((0, 3), dtype=np.float64)
 
         center = self.get_volume_center()
+        renderer = self.renderer
+        view_to_world, _ = self._view_transform()
+
+        # View-space depth of the volume center; every point lands on that plane.
+        center_view = np.linalg.solve(view_to_world, np.array((center[0], center[1], center[2], 1.0)))
+        depth = center_view[2] / center_view[3]
+
+        # Display pixels -> view coordinates (-1..1 across this renderer's viewport).
+        pts = np.asarray(display_points, dtype=np.float64).reshape(-1, 2)
+        origin = np.asarray(renderer.GetOrigin(), dtype=np.float64)
+        size = np.maximum(np.asarray(renderer.GetSize(), dtype=np.float64), 1.0)
+        view = np.empty((len(pts), 4), dtype=np.float64)
+        view[:, :2] = 2.0 * (pts - origin) / size - 1.0
+        view[:, 2] = depth
+        view[:, 3] = 1.0
+
+        world = view @ view_to_world.T
+        w = world[:, 3:]
+        return np.divide(world[:, :3], w, out=world[:, :3].copy(), where=w != 0.0)
+
+    def _view_transform(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the (view -> world) 4x4 matrix and the unit view direction.
 
-        # Get the screen depth (Z-buffer value) of the volume center.
-        self.renderer.SetWorldPoint(center[0], center[1], center[2], 1.0)
-        self.renderer.WorldToDisplay()
-        _, _, depth = self.renderer.GetDisplayPoint()
-
-        projected: list[tuple[float, float, float]] = []
-        for x, y in display_points:
-            self.renderer.SetDisplayPoint(float(x), float(y), float(depth))
-            self.renderer.DisplayToWorld()
-            wx, wy, wz, w = self.renderer.GetWorldPoint()
-            if w != 0.0:
-                wx /= w
-                wy /= w
-                wz /= w
-            projected.append((float(wx), float(wy), float(wz)))
-        return projected
+        Both depend only on the camera and the viewport aspect, so they are
+        rebuilt only when the camera has moved since the last call.
+        """
+        renderer = self.renderer
+        camera = renderer.GetActiveCamera()
+        aspect = renderer.GetTiledAspectRatio()
+        key = (camera.GetMTime(), aspect)
+        cached = self._view_transform_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        m = camera.GetCompositeProjectionTransformMatrix(aspect, -1.0, 1.0)
+        world_to_view = np.array(
+            [[m.GetElement(i, j) for j in range(4)] for i in range(4)],
+            dtype=np.float64,
+        )
+        view_vec = np.subtract(camera.GetFocalPoint(), camera.GetPosition())
+        view_dir = view_vec / np.linalg.norm(view_vec)
+        result = (np.linalg.inv(world_to_view), view_dir)
+        self._view_transform_cache = (key, result)
+        return result
 
     def _clear_clipper_visualization(self) -> None:
         """Clear the clipping region visualization."""
         logger.debug("[VolumeViewer] Clearing clipping region visualization")
-        self.clipper_polydata.Initialize()
+        self._reset_clipper_polydata()
         self.update_view()
 
+    def _reset_clipper_polydata(self) -> None:
+        """Empty the clipper outline while keeping its arrays attached."""
+        self._last_clip_key = None
+        self._clip_cells_n = 0
+        self._clip_points.SetNumberOfPoints(0)
+        self._clip_verts.Reset()
+        self._clip_lines.Reset()
+        self.clipper_polydata.DeleteCells()
+        self.clipper_polydata.Modified()
+
     def enter_clip_result_mode(self) -> None:
         """
         Enter clip result mode
@@ -1156,78 +1476,115 @@ class VolumeViewer(BaseViewer):
         world_points = self.clipping_operation.get_preview_world_points()
 
         if not world_points:
-            self.clipper_polydata.Initialize()
-            self.update_view()
+            self._reset_clipper_polydata()
+            self.request_render()
             return
 
-        camera = self.renderer.GetActiveCamera()
-        cam_pos = camera.GetPosition()
-        bounds = self.renderer.ComputeVisiblePropBounds()
-        diag = math.sqrt(
-            sum((bounds[2 * i + 1] - bounds[2 * i]) ** 2 for i in range(3))
-        ) or 1.0
-        offset = 0.002 * diag
-
-        points = vtk.vtkPoints()
-        verts = vtk.vtkCellArray()
-        lines = vtk.vtkCellArray()
-
-        n = len(world_points)
-        for i, pt in enumerate(world_points):
-            to_cam = [cam_pos[j] - pt[j] for j in range(3)]
-            length = geometry_utils.calculate_norm(to_cam)
-
-            if length:
-                disp_pt = [pt[j] + to_cam[j] / length * offset for j in range(3)]
-            else:
-                disp_pt = pt
+        cam_pos = self.camera_controller.camera.GetPosition()
+        offset = 0.002 * self._clipper_scene_diagonal()
 
-            points.InsertNextPoint(*disp_pt)
+        pts = np.asarray(world_points, dtype=np.float64).reshape(-1, 3)
 
-            verts.InsertNextCell(1)
-            verts.InsertCellPoint(i)
+        # Camera-only interactions often leave the preview untouched.
+        key = (pts.tobytes(), cam_pos, offset)
+        if key == self._last_clip_key:
+            return
+        self._last_clip_key = key
 
-            if i > 0:
-                lines.InsertNextCell(2)
-                lines.InsertCellPoint(i - 1)
-                lines.InsertCellPoint(i)
+        # Nudge every vertex towards the camera so the outline stays on top.
+        disp = _offset_towards(pts, np.asarray(cam_pos, dtype=np.float64), offset)
 
-        # Close the loop for polygons
-        if n >= 3:
-            lines.InsertNextCell(2)
-            lines.InsertCellPoint(n - 1)
-            lines.InsertCellPoint(0)
+        # Refill the arrays attached in _setup_clipping instead of allocating new ones.
+        n = len(pts)
+        self._clip_points.SetNumberOfPoints(n)
+        vtk_to_numpy(self._clip_points.GetData())[:] = disp
+        self._clip_points.Modified()
 
-        self.clipper_polydata.SetPoints(points)
-        self.clipper_polydata.SetVerts(verts)
-        self.clipper_polydata.SetLines(lines)
+        # Camera moves and vertex drags keep the topology; only points changed.
+        if n == self._clip_cells_n:
+            self.clipper_polydata.Modified()
+            self.request_render()
+            return
+        self._clip_cells_n = n
+
+        # Id and line-connectivity buffers only grow; each redraw uses a slice.
+        if len(self._clip_ids) <= n:
+            capacity = max(n + 1, 2 * len(self._clip_ids))
+            self._clip_ids = np.arange(capacity, dtype=np.int64)
+            self._clip_line_conn = np.empty(2 * capacity, dtype=np.int64)
+        ids = self._clip_ids
+        _fill_cell_array(self._clip_verts, ids[:n], 1, ids)
+
+        # Consecutive segments (i, i + 1), closing the loop for polygons
+        n_segments = n if n >= 3 else max(n - 1, 0)
+        conn = self._clip_line_conn[:2 * n_segments]
+        conn[0::2] = ids[:n_segments]
+        conn[1::2] = ids[1:n_segments + 1]
+        if n >= 3:
+            conn[-1] = 0
+        _fill_cell_array(self._clip_lines, conn, 2, ids)
 
-        self.update_view()
+        # Drop the random-access cell map so it is rebuilt from the new cells.
+        self.clipper_polydata.DeleteCells()
+        self.clipper_polydata.Modified()
+        self.request_render()
         
+    def _clipper_scene_diagonal(self) -> float:
+        """
+        Return the scene diagonal used to offset the clipper outline.
+
+        Uses the volume bounds when a volume is loaded so the outline itself
+        is not part of the measurement and no prop traversal is needed.
+        """
+        if self.volume is not None:
+            bounds = self._volume_bounds()
+        else:
+            bounds = self.renderer.ComputeVisiblePropBounds()
+
+        cache = self._clipper_diag_cache
+        if cache is not None and cache[0] == bounds:
+            return cache[1]
+
+        diag = _bounds_diagonal(bounds) or 1.0
+        self._clipper_diag_cache = (bounds, diag)
+        return diag
+
     # =====================================================
     # Camera helpers
     # =====================================================
 
+    def _half_view_angle_tan(self, view_angle: float) -> float | None:
+        """
+        Return tan(view_angle / 2) for a view angle in degrees, or None if ~0.
+
+        The view angle practically never changes, so the last result is reused.
+        """
+        cached = self._half_tan_cache
+        if cached is not None and cached[0] == view_angle:
+            return cached[1]
+        angle_rad = math.radians(view_angle)
+        half_tan = math.tan(angle_rad / 2.0) if angle_rad > 1e-6 else None
+        self._half_tan_cache = (view_angle, half_tan)
+        return half_tan
+
     def _set_camera_parallel_from_current(self) -> None:
         """
         Helper to switch the active camera to parallel projection,
         computing a suitable parallel scale from the perspective camera parameters or
         visible bounds.
         """
-        cam: vtk.vtkCamera = self.renderer.GetActiveCamera()
+        cam: vtk.vtkCamera = self.camera_controller.camera
         pos = cam.GetPosition()
         fp = cam.GetFocalPoint()
         dist = math.dist(pos, fp)
         if dist == 0.0:
             dist = 1.0
-        angle_rad = math.radians(cam.GetViewAngle())
-        if angle_rad > 1e-6:
-            parallel_scale = dist * math.tan(angle_rad / 2.0)
+        half_tan = self._half_view_angle_tan(cam.GetViewAngle())
+        if half_tan is not None:
+            parallel_scale = dist * half_tan
         else:
             bounds = self.renderer.ComputeVisiblePropBounds()
-            diag = math.sqrt(
-                sum((bounds[2 * i + 1] - bounds[2 * i]) ** 2 for i in range(3))
-            ) or 1.0
+            diag = _bounds_diagonal(bounds) or 1.0
             parallel_scale = diag * 0.5
         cam.ParallelProjectionOn()
         cam.SetParallelScale(parallel_scale)
@@ -0,0 +1,32 @@
+"""Tests for the immutable WindowSettings value object."""
+
+import dataclasses
+
+import pytest
+
+from qv.core.window_settings import WindowSettings
+
+
+def test_window_settings_is_frozen():
+    settings = WindowSettings(level=40.0, width=400.0)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.level = 0.0
+
+
+def test_get_range_is_centered_on_level():
+    assert WindowSettings(level=40.0, width=400.0).get_range() == (-160.0, 240.0)
+
+
+def test_adjust_applies_deltas_within_scalar_range():
+    settings = WindowSettings(level=40.0, width=400.0)
+
+    adjusted = settings.adjust(delta_level=5.0, delta_width=10.0, scalar_range=(-1024.0, 3071.0))
+
+    assert adjusted == WindowSettings(level=45.0, width=410.0)
+
+
+def test_adjust_below_min_width_returns_self():
+    settings = WindowSettings(level=0.0, width=1.0)
+
+    assert settings.adjust(delta_level=0.0, delta_width=-5.0) is settings
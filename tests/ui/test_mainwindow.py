@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import pytest
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtWidgets
 
 import qv.ui.mainwindow as mainwindow_module
 
@@ -88,3 +88,72 @@ def test_preference_action_opens_settings_dialog_with_shared_manager(
     assert dialog.settings_manager is settings_manager
     assert dialog.parent is window
     assert dialog.exec_calls == 1
+
+
+class SignalVolumeViewer(QtWidgets.QWidget):
+    cameraAngleChanged = QtCore.Signal(float, float)
+    windowSettingsChanged = QtCore.Signal(object)
+    dataLoaded = QtCore.Signal()
+    loadStarted = QtCore.Signal(str)
+    loadFailed = QtCore.Signal(str)
+
+    current_profile_name = "balanced"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.history = FakeHistory()
+        self.opacity_func = None
+        self._source_image = None
+
+    def __getattr__(self, name):
+        """Return no-op callbacks required while menu actions are constructed."""
+        return lambda *args, **kwargs: None
+
+
+class SignalMultiViewerPanel(QtWidgets.QWidget):
+    layout_mode = mainwindow_module.ViewerLayoutMode.QUAD
+
+    def __init__(self, settings_mgr=None, parent=None, layout_mode=None) -> None:
+        super().__init__(parent)
+        self.volume_viewer = SignalVolumeViewer()
+        self.mpr_viewer = QtWidgets.QWidget()
+
+    def set_layout_mode(self, mode) -> None:
+        self.layout_mode = mode
+
+
+class RecordingNotifier:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+
+    def notify(self, title: str, msg: str, **kwargs) -> None:
+        self.calls.append((title, msg))
+
+
+def test_failed_background_load_is_reported_and_clears_busy_state(
+        monkeypatch: pytest.MonkeyPatch,
+        qtbot,
+) -> None:
+    notifier = RecordingNotifier()
+    monkeypatch.setattr(mainwindow_module, "ShortcutManager", FakeShortcutManager)
+    monkeypatch.setattr(mainwindow_module, "MultiViewerPanel", SignalMultiViewerPanel)
+    monkeypatch.setattr(mainwindow_module.ErrorNotifier, "instance", classmethod(lambda cls: notifier))
+    monkeypatch.setattr(mainwindow_module.MainWindow,
+                        "_register_shortcuts",
+                        lambda self: None,
+                        )
+
+    window = mainwindow_module.MainWindow(settings_mgr=object())
+    qtbot.addWidget(window)
+    viewer = window.volume_viewer
+
+    viewer.loadStarted.emit("/data/series")
+
+    assert "/data/series" in window.statusBar().currentMessage()
+    assert QtWidgets.QApplication.overrideCursor() is not None
+
+    viewer.loadFailed.emit("no DICOM files found")
+
+    assert notifier.calls == [("Failed to load volume", "no DICOM files found")]
+    assert window.statusBar().currentMessage() == "Failed to load volume"
+    assert QtWidgets.QApplication.overrideCursor() is None
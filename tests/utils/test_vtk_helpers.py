@@ -0,0 +1,57 @@
+"""Tests for the scalar narrowing applied to loaded volumes."""
+
+import numpy as np
+import pytest
+import vtk
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+
+from qv.utils.vtk_helpers import narrow_to_16bit_scalars
+
+
+def _image(values: np.ndarray, vtk_type: int) -> vtk.vtkImageData:
+    image = vtk.vtkImageData()
+    image.SetDimensions(len(values), 1, 1)
+    image.GetPointData().SetScalars(numpy_to_vtk(values, deep=True, array_type=vtk_type))
+    return image
+
+
+@pytest.mark.parametrize(
+    ("dtype", "vtk_type"),
+    [
+        (np.uint8, vtk.VTK_UNSIGNED_CHAR),
+        (np.int8, vtk.VTK_SIGNED_CHAR),
+        (np.int16, vtk.VTK_SHORT),
+        (np.uint16, vtk.VTK_UNSIGNED_SHORT),
+        (np.float32, vtk.VTK_FLOAT),
+        (np.float64, vtk.VTK_DOUBLE),
+    ],
+)
+def test_narrow_keeps_16bit_and_smaller_and_float_images(dtype, vtk_type):
+    image = _image(np.array([0, 1, 100], dtype=dtype), vtk_type)
+
+    assert narrow_to_16bit_scalars(image) is image
+
+
+def test_narrow_casts_int_in_short_range_to_short():
+    values = np.array([-1024, 0, 3071], dtype=np.int32)
+
+    result = narrow_to_16bit_scalars(_image(values, vtk.VTK_INT))
+
+    assert result.GetScalarType() == vtk.VTK_SHORT
+    np.testing.assert_array_equal(vtk_to_numpy(result.GetPointData().GetScalars()), values)
+
+
+def test_narrow_casts_non_negative_int_above_short_range_to_unsigned_short():
+    values = np.array([0, 40000, 65535], dtype=np.uint32)
+
+    result = narrow_to_16bit_scalars(_image(values, vtk.VTK_UNSIGNED_INT))
+
+    assert result.GetScalarType() == vtk.VTK_UNSIGNED_SHORT
+    np.testing.assert_array_equal(vtk_to_numpy(result.GetPointData().GetScalars()), values)
+
+
+def test_narrow_keeps_int_outside_16bit_range(caplog):
+    image = _image(np.array([-1, 70000], dtype=np.int32), vtk.VTK_INT)
+
+    assert narrow_to_16bit_scalars(image) is image
+    assert "does not fit 16 bits" in caplog.text
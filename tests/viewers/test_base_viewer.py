@@ -0,0 +1,51 @@
+"""Tests for BaseViewer's render-window setup."""
+
+from __future__ import annotations
+
+import pytest
+
+from qv.viewers.base_viewer import BaseViewer
+
+
+class _PlainViewer(BaseViewer):
+    def setup_interactor_style(self) -> None:
+        pass
+
+    def load_data(self, *args, **kwargs) -> None:
+        pass
+
+
+@pytest.fixture
+def plain_viewer(qtbot, settings_manager, monkeypatch):
+    monkeypatch.setattr(BaseViewer, "_initialize_interactor", lambda self: None)
+
+    viewer = _PlainViewer(settings_manager=settings_manager)
+    qtbot.addWidget(viewer)
+    return viewer
+
+
+def test_overlay_disabled_uses_single_layer(plain_viewer):
+    render_window = plain_viewer.vtk_widget.GetRenderWindow()
+
+    assert render_window.GetNumberOfLayers() == 1
+    assert not render_window.HasRenderer(plain_viewer.overlay_renderer)
+    assert plain_viewer.renderer.HasViewProp(plain_viewer._window_overlay_actor)
+
+
+def test_set_overlay_enabled_attaches_and_detaches_layer(plain_viewer):
+    render_window = plain_viewer.vtk_widget.GetRenderWindow()
+
+    plain_viewer.set_overlay_enabled(True)
+    assert render_window.GetNumberOfLayers() == 2
+    assert render_window.HasRenderer(plain_viewer.overlay_renderer)
+
+    plain_viewer.set_overlay_enabled(False)
+    assert render_window.GetNumberOfLayers() == 1
+    assert not render_window.HasRenderer(plain_viewer.overlay_renderer)
+
+
+def test_mpr_viewer_attaches_overlay_layer(mpr_viewer):
+    render_window = mpr_viewer.vtk_widget.GetRenderWindow()
+
+    assert render_window.GetNumberOfLayers() == 2
+    assert render_window.HasRenderer(mpr_viewer.overlay_renderer)
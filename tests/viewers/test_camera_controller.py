@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import pytest
+import vtk
+
+from qv.viewers.camera.camera_controller import CameraController
+from qv.viewers.camera.camera_state import CameraAngle
+
+BOUNDS = (0.0, 10.0, 0.0, 20.0, 0.0, 30.0)
+
+
+@pytest.fixture
+def controller() -> CameraController:
+    renderer = vtk.vtkRenderer()
+    return CameraController(renderer.GetActiveCamera(), renderer)
+
+
+def test_rotate_after_preset_continues_from_preset_angle(controller: CameraController) -> None:
+    controller.reset_to_bounds(BOUNDS, view="front")
+    assert controller.state.angle == CameraAngle(0.0, 0.0)
+
+    angle = controller.rotate(10.0, 5.0)
+
+    assert angle.azimuth == pytest.approx(10.0)
+    assert angle.elevation == pytest.approx(5.0)
+
+
+def test_rotate_after_side_preset_continues_from_preset_angle(controller: CameraController) -> None:
+    controller.reset_to_bounds(BOUNDS, view="left")
+
+    angle = controller.rotate(-20.0, 0.0)
+
+    assert angle.azimuth == pytest.approx(70.0)
+    assert angle.elevation == pytest.approx(0.0, abs=1e-9)
+
+
+def test_reset_to_bounds_with_unchanged_angle_does_not_notify(controller: CameraController) -> None:
+    controller.reset_to_bounds(BOUNDS, view="front")
+    received: list[CameraAngle] = []
+    controller.add_angle_changed_callback(received.append)
+
+    controller.reset_to_bounds(BOUNDS, view="front")
+
+    assert received == []
+
+
+def test_zoom_keeps_angle(controller: CameraController) -> None:
+    controller.reset_to_bounds(BOUNDS, view="front")
+    controller.rotate(30.0, 0.0)
+    received: list[CameraAngle] = []
+    controller.add_angle_changed_callback(received.append)
+
+    controller.set_zoom(2.0)
+
+    assert received == []
+    assert controller.azimuth == pytest.approx(30.0)
+
+
+def test_dispose_detaches_camera_observer(controller: CameraController) -> None:
+    controller.reset_to_bounds(BOUNDS, view="front")
+    controller.dispose()
+    received: list[CameraAngle] = []
+    controller.add_angle_changed_callback(received.append)
+
+    controller.camera.Azimuth(15.0)
+
+    assert received == []
+
+
+def test_azimuth_accumulates_past_180_degrees(controller: CameraController) -> None:
+    controller.reset_to_bounds(BOUNDS, view="front")
+
+    controller.rotate(100.0, 0.0)
+    angle = controller.rotate(100.0, 0.0)
+
+    assert angle.azimuth == pytest.approx(200.0)
+    assert angle.elevation == pytest.approx(0.0, abs=1e-9)
+
+
+def test_elevation_accumulates_past_90_degrees(controller: CameraController) -> None:
+    controller.reset_to_bounds(BOUNDS, view="front")
+
+    controller.rotate(0.0, 60.0)
+    angle = controller.rotate(0.0, 60.0)
+
+    assert angle.azimuth == pytest.approx(0.0, abs=1e-9)
+    assert angle.elevation == pytest.approx(120.0)
+
+
+def test_negative_rotation_wraps_into_0_360(controller: CameraController) -> None:
+    controller.reset_to_bounds(BOUNDS, view="front")
+
+    angle = controller.rotate(-30.0, -20.0)
+
+    assert angle.azimuth == pytest.approx(330.0)
+    assert angle.elevation == pytest.approx(340.0)
+
+
+def test_single_elevation_step_over_90_degrees_folds_into_azimuth(controller: CameraController) -> None:
+    controller.reset_to_bounds(BOUNDS, view="front")
+
+    angle = controller.rotate(0.0, 120.0)
+
+    # Read against the rotated view-up: azimuth 180 / elevation -60.
+    assert angle.azimuth == pytest.approx(180.0)
+    assert angle.elevation == pytest.approx(300.0)
+
+
+def test_interactor_style_steps_are_tracked(controller: CameraController) -> None:
+    controller.reset_to_bounds(BOUNDS, view="front")
+
+    for _ in range(20):
+        controller.camera.Azimuth(5.0)
+        controller.camera.Elevation(5.0)
+        controller.camera.OrthogonalizeViewUp()
+
+    assert controller.azimuth == pytest.approx(100.0)
+    assert controller.elevation == pytest.approx(100.0)
+
+
+def test_untracked_controller_has_no_observer_but_rotate_updates_angle() -> None:
+    renderer = vtk.vtkRenderer()
+    camera = renderer.GetActiveCamera()
+    controller = CameraController(camera, renderer, track_angle=False)
+    controller.reset_to_bounds(BOUNDS, view="front")
+
+    assert not camera.HasObserver(vtk.vtkCommand.ModifiedEvent)
+
+    angle = controller.rotate(10.0, 5.0)
+    camera.Azimuth(30.0)
+
+    assert angle == CameraAngle(10.0, 5.0)
+    assert controller.state.angle == CameraAngle(10.0, 5.0)
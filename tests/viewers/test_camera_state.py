@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from qv.viewers.camera.camera_state import CameraAngle, CameraStateManager
+
+
+def test_set_angle_notifies_callbacks_with_new_angle() -> None:
+    state = CameraStateManager()
+    received: list[CameraAngle] = []
+    state.add_angle_changed_callback(received.append)
+
+    state.set_angle(30.0, 10.0)
+
+    assert received == [CameraAngle(30.0, 10.0)]
+
+
+def test_set_angle_skips_notification_when_unchanged() -> None:
+    state = CameraStateManager()
+    received: list[CameraAngle] = []
+    state.add_angle_changed_callback(received.append)
+
+    state.set_angle(0.0, 0.0)
+
+    assert received == []
+
+
+def test_batch_emits_single_notification_with_final_angle() -> None:
+    state = CameraStateManager()
+    received: list[CameraAngle] = []
+    state.add_angle_changed_callback(received.append)
+
+    with state.batch():
+        state.set_angle(10.0, 0.0)
+        with state.batch():
+            state.set_angle(20.0, 5.0)
+        assert received == []
+
+    assert received == [CameraAngle(20.0, 5.0)]
+
+
+def test_batch_without_change_does_not_notify() -> None:
+    state = CameraStateManager()
+    received: list[CameraAngle] = []
+    state.add_angle_changed_callback(received.append)
+
+    with state.batch():
+        pass
+
+    assert received == []
+
+
+def test_failing_callback_does_not_block_later_callbacks() -> None:
+    state = CameraStateManager()
+    received: list[CameraAngle] = []
+
+    def broken(_angle: CameraAngle) -> None:
+        raise RuntimeError("boom")
+
+    state.add_angle_changed_callback(broken)
+    state.add_angle_changed_callback(received.append)
+
+    state.set_angle(45.0, 0.0)
+
+    assert received == [CameraAngle(45.0, 0.0)]
+
+
+def test_removing_callbacks_switches_dispatch_path() -> None:
+    state = CameraStateManager()
+    first: list[CameraAngle] = []
+    second: list[CameraAngle] = []
+
+    state.add_angle_changed_callback(first.append)
+    state.add_angle_changed_callback(second.append)
+    state.set_angle(10.0, 0.0)
+
+    state.remove_angle_changed_callback(first.append)
+    state.set_angle(20.0, 0.0)
+
+    state.remove_angle_changed_callback(second.append)
+    state.set_angle(30.0, 0.0)
+
+    assert first == [CameraAngle(10.0, 0.0)]
+    assert second == [CameraAngle(10.0, 0.0), CameraAngle(20.0, 0.0)]
+
+
+def test_duplicate_callback_registration_is_ignored() -> None:
+    state = CameraStateManager()
+    received: list[CameraAngle] = []
+    state.add_angle_changed_callback(received.append)
+    state.add_angle_changed_callback(received.append)
+
+    state.set_angle(CameraAngle(5.0, 0.0))
+
+    assert received == [CameraAngle(5.0, 0.0)]
+
+
+def test_batch_returning_to_start_angle_does_not_notify() -> None:
+    state = CameraStateManager()
+    received: list[CameraAngle] = []
+    state.add_angle_changed_callback(received.append)
+
+    with state.batch():
+        state.set_angle(10.0, 0.0)
+        state.set_angle(0.0, 0.0)
+
+    assert received == []
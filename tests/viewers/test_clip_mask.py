@@ -0,0 +1,189 @@
+"""Tests for the clip-mask extent and accumulation helpers of VolumeViewer."""
+
+from __future__ import annotations
+
+import types
+
+import numpy as np
+import pytest
+import vtk
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+from qv.operations.clipping.clipping_operation import ClipMode
+from qv.viewers.volume_viewer import (
+    VolumeViewer,
+    _axis_aligned_box_extent,
+    _constant_uint8_image,
+    _world_box_extent,
+)
+
+VIEW_Z = np.array((0.0, 0.0, 1.0))
+
+
+@pytest.fixture
+def grid() -> vtk.vtkImageData:
+    """12x10x8 voxels, origin (-5, 2, 10), spacing (0.5, 1, 2)."""
+    image = vtk.vtkImageData()
+    image.SetDimensions(12, 10, 8)
+    image.SetOrigin(-5.0, 2.0, 10.0)
+    image.SetSpacing(0.5, 1.0, 2.0)
+    image.AllocateScalars(vtk.VTK_SHORT, 1)
+    return image
+
+
+def _scalars(image: vtk.vtkImageData) -> np.ndarray:
+    return vtk_to_numpy(image.GetPointData().GetScalars()).reshape(image.GetDimensions()[::-1])
+
+
+def _is_empty(extent: tuple[int, ...]) -> bool:
+    return any(extent[2 * a + 1] < extent[2 * a] for a in range(3))
+
+
+def _reference_keep_mask(image: vtk.vtkImageData, world_pts: np.ndarray, view_dir: np.ndarray,
+                         mode: ClipMode) -> np.ndarray:
+    """Keep mask from the implicit selection loop stencil the viewer used to build."""
+    points = vtk.vtkPoints()
+    for p in world_pts:
+        points.InsertNextPoint(*p)
+    loop = vtk.vtkImplicitSelectionLoop()
+    loop.SetLoop(points)
+    loop.SetNormal(*view_dir)
+    loop.AutomaticNormalGenerationOff()
+
+    stenciler = vtk.vtkImplicitFunctionToImageStencil()
+    stenciler.SetInput(loop)
+    stenciler.SetOutputOrigin(image.GetOrigin())
+    stenciler.SetOutputSpacing(image.GetSpacing())
+    stenciler.SetOutputWholeExtent(image.GetExtent())
+
+    to_image = vtk.vtkImageStencilToImage()
+    to_image.SetInputConnection(stenciler.GetOutputPort())
+    to_image.SetOutputScalarTypeToUnsignedChar()
+    if mode is ClipMode.REMOVE_INSIDE:
+        to_image.SetInsideValue(0)
+        to_image.SetOutsideValue(255)
+    else:
+        to_image.SetInsideValue(255)
+        to_image.SetOutsideValue(0)
+    to_image.Update()
+    return _scalars(to_image.GetOutput()).copy()
+
+
+def _mask_owner(image: vtk.vtkImageData) -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        _clip_mask_image=_constant_uint8_image(image, 255),
+        _mask_zlib_in_buffer=b"stale",
+    )
+
+
+def _accumulate(owner: types.SimpleNamespace, region: vtk.vtkImageData, outside_value: int) -> np.ndarray:
+    VolumeViewer._accumulate_mask_and(owner, region, outside_value)
+    return _scalars(owner._clip_mask_image)
+
+
+def test_world_box_extent_box_off_volume_is_empty(grid: vtk.vtkImageData) -> None:
+    beyond = _world_box_extent(grid, np.array((100.0, 2.0, 10.0)), np.array((120.0, 5.0, 20.0)))
+    before = _world_box_extent(grid, np.array((-120.0, 2.0, 10.0)), np.array((-100.0, 5.0, 20.0)))
+
+    assert _is_empty(beyond) and _is_empty(before)
+    # Empty axes have zero, never negative, dimensions.
+    assert beyond[1] == beyond[0] - 1
+    assert before[:2] == (0, -1)
+
+
+def test_world_box_extent_is_clipped_at_volume_edge(grid: vtk.vtkImageData) -> None:
+    extent = _world_box_extent(grid, np.array((-100.0, 3.2, 13.0)), np.array((-3.9, 100.0, 14.0)))
+
+    # x: centres up to -3.9 -> i <= 2.2, widened to 3; y: j >= 1.2 -> 1; z: k in [1.5, 2] -> [1, 2]
+    assert extent == (0, 3, 1, 9, 1, 2)
+
+
+def test_world_box_extent_exclusive_keeps_only_centres_inside(grid: vtk.vtkImageData) -> None:
+    extent = _world_box_extent(grid, np.array((-4.2, 3.2, 13.0)), np.array((-3.1, 4.9, 14.0)),
+                               inclusive=False)
+
+    assert extent == (2, 3, 2, 2, 2, 2)
+
+
+def test_axis_aligned_box_extent_rejects_oblique_view(grid: vtk.vtkImageData) -> None:
+    rect = np.array([(-4.0, 3.0, 0.0), (-2.0, 3.0, 0.0), (-2.0, 6.0, 0.0), (-4.0, 6.0, 0.0)])
+
+    assert _axis_aligned_box_extent(grid, rect, (0.0, 0.6, 0.8)) is None
+
+
+def test_axis_aligned_box_extent_rejects_rotated_rectangle(grid: vtk.vtkImageData) -> None:
+    diamond = np.array([(-3.0, 3.0, 0.0), (-2.0, 5.0, 0.0), (-3.0, 7.0, 0.0), (-4.0, 5.0, 0.0)])
+
+    assert _axis_aligned_box_extent(grid, diamond, VIEW_Z) is None
+
+
+@pytest.mark.parametrize("mode", [ClipMode.REMOVE_INSIDE, ClipMode.REMOVE_OUTSIDE])
+def test_axis_aligned_box_matches_reference_stencil(grid: vtk.vtkImageData, mode: ClipMode) -> None:
+    # Plane well outside the volume, edges between voxel centres.
+    rect = np.array([(-3.9, 3.4, -50.0), (-1.6, 3.4, -50.0), (-1.6, 8.6, -50.0), (-3.9, 8.6, -50.0)])
+    inside_value, outside_value = (0, 255) if mode is ClipMode.REMOVE_INSIDE else (255, 0)
+
+    box = _axis_aligned_box_extent(grid, rect, VIEW_Z)
+    assert box is not None
+    mask = _accumulate(_mask_owner(grid), _constant_uint8_image(grid, inside_value, box), outside_value)
+
+    np.testing.assert_array_equal(mask, _reference_keep_mask(grid, rect, VIEW_Z, mode))
+
+
+@pytest.mark.parametrize("mode", [ClipMode.REMOVE_INSIDE, ClipMode.REMOVE_OUTSIDE])
+def test_prism_keep_mask_matches_reference_stencil(grid: vtk.vtkImageData, mode: ClipMode) -> None:
+    # A triangle viewed down z; its plane lies between voxel slices.
+    triangle = np.array([(-4.3, 2.6, 15.0), (-0.3, 4.1, 15.0), (-2.8, 10.2, 15.0)])
+    viewer = types.SimpleNamespace(
+        _source_image=grid,
+        _ndc_points_to_display=lambda pts: pts,
+        _project_display_to_center_plane=lambda _pts: triangle,
+        _view_transform=lambda: (None, VIEW_Z),
+    )
+    VolumeViewer._init_clip_stencil_pipeline(viewer)
+
+    region, outside_value = VolumeViewer._build_keep_mask_from_polygon_ndc(viewer, triangle[:, :2], mode)
+    mask = _accumulate(_mask_owner(grid), region, outside_value)
+
+    np.testing.assert_array_equal(mask, _reference_keep_mask(grid, triangle, VIEW_Z, mode))
+
+
+def test_accumulate_keep_outside_only_touches_region_box(grid: vtk.vtkImageData) -> None:
+    owner = _mask_owner(grid)
+    region = _constant_uint8_image(grid, 0, (2, 4, 1, 3, 5, 6))
+
+    mask = _accumulate(owner, region, 255)
+
+    assert owner._mask_zlib_in_buffer is None
+    assert not mask[5:7, 1:4, 2:5].any()
+    assert np.count_nonzero(mask == 0) == 3 * 3 * 2
+
+
+def test_accumulate_keep_inside_hides_everything_outside_region(grid: vtk.vtkImageData) -> None:
+    owner = _mask_owner(grid)
+    region = _constant_uint8_image(grid, 255, (2, 4, 1, 3, 5, 6))
+
+    mask = _accumulate(owner, region, 0)
+
+    assert (mask[5:7, 1:4, 2:5] == 255).all()
+    assert np.count_nonzero(mask) == 3 * 3 * 2
+
+
+def test_accumulate_intersects_with_previous_cuts(grid: vtk.vtkImageData) -> None:
+    owner = _mask_owner(grid)
+    _accumulate(owner, _constant_uint8_image(grid, 0, (0, 5, 0, 9, 0, 7)), 255)
+
+    mask = _accumulate(owner, _constant_uint8_image(grid, 255, (3, 8, 0, 9, 0, 7)), 0)
+
+    assert (mask[:, :, 6:9] == 255).all()
+    assert np.count_nonzero(mask) == 3 * 10 * 8
+
+
+def test_accumulate_off_volume_region_with_keep_inside_hides_all(grid: vtk.vtkImageData) -> None:
+    owner = _mask_owner(grid)
+    extent = _world_box_extent(grid, np.array((100.0, 2.0, 10.0)), np.array((120.0, 5.0, 20.0)))
+    region = _constant_uint8_image(grid, 255, extent)
+
+    mask = _accumulate(owner, region, 0)
+
+    assert not mask.any()
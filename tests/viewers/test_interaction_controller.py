@@ -0,0 +1,99 @@
+"""Tests for InteractionController mode transitions and callback dispatch."""
+
+from qv.viewers.controllers.interaction_controller import (
+    InteractionController,
+    InteractionMode,
+    MODE_STACK_CAPACITY,
+)
+
+
+def test_set_mode_triggers_exit_enter_and_changed_in_order():
+    controller = InteractionController()
+    events = []
+    controller.add_mode_exit_callback(InteractionMode.DEFAULT, lambda: events.append("exit"))
+    controller.add_mode_enter_callback(InteractionMode.CLIPPING, lambda: events.append("enter"))
+    controller.add_mode_changed_callback(lambda old, new: events.append((old, new)))
+
+    controller.set_mode(InteractionMode.CLIPPING)
+
+    assert events == ["exit", "enter", (InteractionMode.DEFAULT, InteractionMode.CLIPPING)]
+    assert controller.previous_mode == InteractionMode.DEFAULT
+
+
+def test_push_and_pop_mode_restore_previous_mode():
+    controller = InteractionController()
+
+    controller.push_mode(InteractionMode.WINDOWING)
+    controller.push_mode(InteractionMode.ZOOM)
+    assert controller.mode_stack_depth == 2
+
+    assert controller.pop_mode()
+    assert controller.current_mode == InteractionMode.WINDOWING
+    assert controller.pop_or_default() == InteractionMode.DEFAULT
+    assert controller.pop_or_default() == InteractionMode.DEFAULT
+    assert not controller.has_history
+
+
+def test_failing_callback_does_not_block_remaining_callbacks():
+    controller = InteractionController()
+    received = []
+
+    def broken(old, new):
+        raise RuntimeError("boom")
+
+    controller.add_mode_changed_callback(broken)
+    controller.add_mode_changed_callback(lambda old, new: received.append(new))
+
+    controller.set_mode(InteractionMode.PAN)
+
+    assert received == [InteractionMode.PAN]
+
+
+def test_callback_registered_during_dispatch_runs_on_next_change():
+    controller = InteractionController()
+    late = []
+
+    def register_late(old, new):
+        controller.add_mode_changed_callback(lambda o, n: late.append(n))
+
+    controller.add_mode_changed_callback(register_late)
+
+    controller.set_mode(InteractionMode.PAN)
+    assert late == []
+
+    controller.set_mode(InteractionMode.ZOOM)
+    assert late == [InteractionMode.ZOOM]
+
+
+def test_mode_stack_overflow_drops_oldest_entry():
+    controller = InteractionController()
+    modes = [InteractionMode.PAN, InteractionMode.ZOOM]
+
+    for i in range(MODE_STACK_CAPACITY + 2):
+        controller.push_mode(modes[i % 2])
+
+    assert controller.mode_stack_depth == MODE_STACK_CAPACITY
+    while controller.pop_mode():
+        pass
+    # DEFAULT and the first PAN were dropped when the stack overflowed.
+    assert controller.current_mode == InteractionMode.ZOOM
+
+
+def test_reentrant_set_mode_from_callback_dispatches_each_change_once():
+    controller = InteractionController()
+    changes = []
+
+    def enter_nested(old, new):
+        changes.append((old, new))
+        if new == InteractionMode.CLIPPING:
+            controller.push_mode(InteractionMode.ERASURE)
+
+    controller.add_mode_changed_callback(enter_nested)
+
+    controller.set_mode(InteractionMode.CLIPPING)
+
+    assert changes == [
+        (InteractionMode.DEFAULT, InteractionMode.CLIPPING),
+        (InteractionMode.CLIPPING, InteractionMode.ERASURE),
+    ]
+    assert controller.current_mode == InteractionMode.ERASURE
@@ -517,3 +517,37 @@ def test_existing_viewer_uses_updated_wheel_direction_settings(
     # The same viewer now maps wheel forward directly to index +1.
     mpr_viewer.scroll_slice_by_wheel_steps(+1)
     assert mpr_viewer.slice_index == 1
+
+
+def test_request_render_coalesces_into_single_render(mpr_viewer, qtbot, monkeypatch):
+    """
+    Several render requests in one event-loop turn should produce one render.
+    """
+    renders = []
+    monkeypatch.setattr(mpr_viewer.vtk_widget, "Render", lambda: renders.append(1))
+
+    for _ in range(5):
+        mpr_viewer.request_render()
+
+    qtbot.waitUntil(lambda: not mpr_viewer._render_timer.isActive())
+    assert renders == [1]
+
+
+def test_batched_defers_window_signal_and_render(mpr_viewer, sample_image_data, monkeypatch):
+    """
+    Inside _batched(), only the final WW/WL is emitted and one render is issued on exit.
+    """
+    mpr_viewer.set_image_data(sample_image_data)
+    renders = []
+    emitted = []
+    monkeypatch.setattr(mpr_viewer.vtk_widget, "Render", lambda: renders.append(1))
+    mpr_viewer.windowSettingsChanged.connect(emitted.append)
+
+    with mpr_viewer._batched():
+        mpr_viewer.set_window_settings(WindowSettings(level=10.0, width=100.0))
+        mpr_viewer.set_window_settings(WindowSettings(level=20.0, width=200.0))
+        assert emitted == []
+        assert renders == []
+
+    assert emitted == [mpr_viewer.window_settings]
+    assert renders == [1]
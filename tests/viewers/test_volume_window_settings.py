@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import types
+
+import numpy as np
+import vtk
+
+from qv.core.window_settings import WindowSettings
+from qv.viewers.base_viewer import BaseViewer
+from qv.viewers.volume_viewer import VolumeViewer
+
+
+def _volume_viewer_stub() -> types.SimpleNamespace:
+    """Just the state BaseViewer.set_window_settings and the VolumeViewer TF hook use."""
+    viewer = types.SimpleNamespace(
+        scalar_range=(-1024.0, 3071.0),
+        color_func=vtk.vtkColorTransferFunction(),
+        opacity_func=vtk.vtkPiecewiseFunction(),
+        _last_tf_range=None,
+        _window_settings=None,
+        _batch_depth=0,
+        renders=[],
+        emitted=[],
+    )
+    viewer._tf_color_nodes = np.zeros((3, 4))
+    viewer._tf_opacity_nodes = np.zeros((3, 2))
+    viewer._sync_window_overlay_text = lambda: None
+    viewer._apply_window_settings = lambda settings: VolumeViewer._apply_window_settings(viewer, settings)
+    viewer.windowSettingsChanged = types.SimpleNamespace(emit=viewer.emitted.append)
+    viewer.update_view = lambda: viewer.renders.append(1)
+    return viewer
+
+
+def test_sub_hu_change_skips_tf_rewrite_but_still_renders() -> None:
+    viewer = _volume_viewer_stub()
+    BaseViewer.set_window_settings(viewer, WindowSettings(level=40.0, width=400.0))
+    color_mtime = viewer.color_func.GetMTime()
+    viewer.renders.clear()
+
+    BaseViewer.set_window_settings(viewer, WindowSettings(level=40.3, width=400.0))
+
+    assert viewer.color_func.GetMTime() == color_mtime
+    assert viewer.renders == [1]
+    assert viewer.emitted[-1] == WindowSettings(level=40.3, width=400.0)
+
+
+def test_window_change_rewrites_transfer_functions() -> None:
+    viewer = _volume_viewer_stub()
+    BaseViewer.set_window_settings(viewer, WindowSettings(level=40.0, width=400.0))
+
+    BaseViewer.set_window_settings(viewer, WindowSettings(level=100.0, width=400.0))
+
+    assert viewer.color_func.GetRange() == (-100.0, 300.0)
+    assert viewer.renders == [1, 1]